@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+import os
+import shutil
+import tempfile
+import threading
+
+Server = __import__('10-reload_pagination').Server
+
+copy = os.path.join(tempfile.mkdtemp(), "names.csv")
+shutil.copy(Server.DATA_FILE, copy)
+
+server = Server()
+server.DATA_FILE = copy
+print(server.get_hyper_index(19416, 5))
+
+with open(copy, "a") as f:
+    f.write("2017,FEMALE,HISPANIC,Ada,10,1\n2017,MALE,HISPANIC,Leo,9,2\n")
+print(server.refresh(), server.refresh())
+print(server.get_hyper_index(19416, 5))
+print(server.get_hyper(4855, 4)["next_page"])
+
+with open(copy, "w") as f:
+    f.write("Year of Birth,Gender,Ethnicity,Child's First Name,Count,Rank\n")
+    f.write("2018,FEMALE,HISPANIC,Zoe,12,1\n")
+print(server.refresh())
+print(server.get_hyper(1, 10))
+
+stop = threading.Event()
+errors = []
+
+
+def reader():
+    """ Checks that the last page always ends the dataset """
+    while not stop.is_set():
+        total = server.get_hyper(1, 1000)["total_pages"]
+        page = server.get_hyper(total, 1000)
+        if page["next_page"] is not None and page["total_pages"] == total:
+            errors.append(page)
+
+
+thread = threading.Thread(target=reader)
+thread.start()
+server.start_watcher(0.01)
+for year in range(2019, 2029):
+    with open(copy, "a") as f:
+        f.writelines("{},MALE,HISPANIC,Kid{},5,1\n".format(year, i)
+                     for i in range(500))
+    server.refresh()
+server.stop_watcher()
+stop.set()
+thread.join()
+print(len(server.dataset()), errors)
+os.remove(copy)
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""Hot-reloading pagination.
+
+This module provides a Server that picks up changes to
+the CSV file without a restart. Each version of the
+dataset is an immutable Snapshot; refresh builds the
+next one aside, parsing only the appended lines when the
+file grew by appending, up to its last line break, and
+the whole file otherwise, then swaps it in with a single
+assignment. Requests read the current snapshot once and
+never wait for a reload, and a watcher thread can
+refresh in the background.
+"""
+import csv
+import io
+import math
+import os
+import threading
+from typing import Dict, Optional
+
+index_range = __import__('0-simple_helper_function').index_range
+ColumnarServer = __import__('4-columnar_pagination').Server
+ColumnarDataset = __import__('4-columnar_pagination').ColumnarDataset
+
+BOUNDARY_SIZE = 4096
+
+
+class Snapshot:
+    """
+    One version of the dataset and of the file it was
+    parsed from.
+
+    Attributes:
+        dataset (ColumnarDataset): The rows, never modified
+            once the snapshot is published.
+        size (int): The end of the last complete line of
+            the file, from which appended lines are parsed.
+        mtime (int): The modification time of the file, in
+            nanoseconds.
+        boundary (bytes): The last bytes before size, used
+            to tell an append from a rewrite.
+        tail (bool): Whether the last row was parsed from a
+            line after size that had no line break.
+    """
+    def __init__(self, dataset: ColumnarDataset, size: int = 0,
+                 mtime: int = 0, boundary: bytes = b"",
+                 tail: bool = False):
+        """
+        Initializes a snapshot.
+        """
+        self.dataset = dataset
+        self.size = size
+        self.mtime = mtime
+        self.boundary = boundary
+        self.tail = tail
+
+
+class Server(ColumnarServer):
+    """
+    Server class to paginate a database of popular baby
+    names that reloads it when the file changes.
+
+    Attributes:
+        watcher: The background thread and its stop event,
+            if running.
+    """
+    def __init__(self):
+        """
+        Initializes a new Server instance, setting the
+        snapshot to None initially.
+        """
+        super().__init__()
+        self.__snapshot = None
+        self.__lock = threading.Lock()
+        self.watcher = None
+
+    def snapshot(self) -> Snapshot:
+        """
+        Returns the current snapshot, loading the file on
+        first use.
+        """
+        if self.__snapshot is None:
+            if not self.refresh() and self.__snapshot is None:
+                print("Error: Data file not found.")
+                self.__snapshot = Snapshot(ColumnarDataset([]))
+        return self.__snapshot
+
+    def dataset(self) -> ColumnarDataset:
+        """
+        Returns the rows of the current snapshot.
+
+        Returns:
+            ColumnarDataset: The loaded dataset excluding the
+            header.
+        """
+        return self.snapshot().dataset
+
+    def refresh(self) -> bool:
+        """
+        Builds and publishes a new snapshot if the file
+        changed since the current one was parsed.
+
+        Returns:
+            bool: Whether a new snapshot was published.
+        """
+        with self.__lock:
+            current = self.__snapshot
+            try:
+                with open(self.DATA_FILE, "rb") as f:
+                    stat = os.fstat(f.fileno())
+                    if current is not None and \
+                            (current.size, current.mtime) == \
+                            (stat.st_size, stat.st_mtime_ns):
+                        return False
+                    snapshot = self.__build(f, stat, current)
+            except FileNotFoundError:
+                return False
+            if snapshot is None:
+                return False
+            self.__snapshot = snapshot
+            return True
+
+    def __appended(self, f: io.BufferedReader, size: int,
+                   current: Optional[Snapshot]) -> bool:
+        """
+        Whether the file only grew by lines appended after
+        the current snapshot.
+        """
+        if current is None or current.size == 0 or size < current.size:
+            return False
+        f.seek(current.size - len(current.boundary))
+        return f.read(len(current.boundary)) == current.boundary
+
+    def __build(self, f: io.BufferedReader, stat: os.stat_result,
+                current: Optional[Snapshot]) -> Snapshot:
+        """
+        Parses the file, or only its appended lines, into a
+        new snapshot.
+
+        A whole file is parsed to its end, even if its last
+        line has no line break. Appended lines are parsed
+        from the end of the last complete line, replacing a
+        row parsed from an unterminated line before, and up
+        to the last line break, as the line after it may
+        still be being written.
+
+        Returns:
+            Snapshot: The new snapshot, or None if no complete
+            line was appended.
+        """
+        appended = self.__appended(f, stat.st_size, current)
+        start = current.size if appended else 0
+        f.seek(start)
+        data = f.read(stat.st_size - start)
+        end = data.rfind(b"\n") + 1
+        if appended:
+            if not end:
+                return None
+            dataset = current.dataset
+            if current.tail:
+                dataset = dataset.take(range(len(dataset) - 1))
+            else:
+                dataset = dataset.copy()
+            dataset.extend(csv.reader(io.StringIO(data[:end].decode())))
+            boundary = current.boundary + data[:end]
+            tail = False
+        else:
+            rows = csv.reader(io.StringIO(data.decode()))
+            dataset = ColumnarDataset(next(rows, []))
+            dataset.extend(rows)
+            boundary = data[:end]
+            tail = 0 < end < len(data)
+        return Snapshot(dataset, start + end, stat.st_mtime_ns,
+                        boundary[-BOUNDARY_SIZE:], tail)
+
+    def start_watcher(self, interval: float = 1.0) -> None:
+        """
+        Refreshes the snapshot from a background thread
+        every interval seconds.
+        """
+        self.stop_watcher()
+        stopped = threading.Event()
+
+        def watch():
+            """ Watcher loop """
+            while not stopped.wait(interval):
+                try:
+                    self.refresh()
+                except Exception as e:
+                    print(f"Error in refresh: {e}")
+
+        thread = threading.Thread(target=watch, daemon=True)
+        self.watcher = (thread, stopped)
+        thread.start()
+
+    def stop_watcher(self) -> None:
+        """
+        Stops the background watcher, if running.
+        """
+        if self.watcher is not None:
+            thread, stopped = self.watcher
+            stopped.set()
+            thread.join()
+            self.watcher = None
+
+    def get_hyper(self, page: int = 1, page_size: int = 10) -> Dict:
+        """
+        Retrieves information about a page, including data
+        and pagination details, from a single snapshot.
+
+        Args:
+            page (int): The page number (1-indexed).
+            page_size (int): The number of items per page.
+
+        Returns:
+            Dict: A dictionary with page size, page number,
+            data, next page, previous page, and total pages.
+        """
+        assert type(page) == int and type(page_size) == int, \
+            "Page and page size must be integers."
+        assert page > 0 and page_size > 0, \
+            "Page and page size must be positive."
+
+        data = self.dataset()
+        start, end = index_range(page, page_size)
+        page_data = data[start:end]
+        return {
+            'page_size': len(page_data),
+            'page': page,
+            'data': page_data,
+            'next_page': page + 1 if end < len(data) else None,
+            'prev_page': page - 1 if start > 0 else None,
+            'total_pages': math.ceil(len(data) / page_size),
+        }
+
+    def get_hyper_index(self, index: int = None, page_size: int = 10) -> Dict:
+        """
+        Retrieves information about a page from a given
+        index and with a specified size, from a single
+        snapshot.
+
+        Args:
+            index (int): The starting index of the data.
+            page_size (int): The number of items per page.
+
+        Returns:
+            Dict: A dictionary with index, next index, page
+            size, and data.
+
+        Raises:
+            AssertionError: If index is not a valid position
+            in the dataset.
+        """
+        data = self.dataset()
+        assert index is not None and 0 <= index < len(data)
+        page_data = data[index:index + page_size]
+        next_index = index + len(page_data)
+        return {
+            'index': index,
+            'next_index': next_index if next_index < len(data) else None,
+            'page_size': len(page_data),
+            'data': page_data,
+        }
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+import os
+import tempfile
+import time
+
+parallel = __import__('11-parallel_pagination')
+ColumnarDataset = __import__('4-columnar_pagination').ColumnarDataset
+
+server = parallel.Server(workers=4, chunk_size=1 << 16)
+print(server.get_page(1, 3))
+print(server.get_hyper(1942, 10)["data"][-1])
+
+path = os.path.join(tempfile.mkdtemp(), "names.csv")
+with open(server.DATA_FILE) as f:
+    header, body = f.readline(), f.read()
+with open(path, "w") as f:
+    f.write(header)
+    for _ in range(40):
+        f.write(body)
+
+start = time.perf_counter()
+serial = ColumnarDataset.from_csv(path)
+middle = time.perf_counter()
+loaded = parallel.load_parallel(path, workers=4, chunk_size=1 << 20)
+end = time.perf_counter()
+print(len(loaded), list(loaded) == list(serial))
+print("serial {:.2f} s, 4 workers {:.2f} s on {} CPUs".format(
+    middle - start, end - middle, os.cpu_count()))
+os.remove(path)
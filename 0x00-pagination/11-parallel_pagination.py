@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Parallel loading pagination.
+
+This module provides load_parallel, which splits a CSV
+file into chunks that end on record boundaries, parses
+them in a pool of processes, each reading its own byte
+range of the file into a ColumnarDataset, and merges the
+chunks in file order into one ColumnarDataset, so the
+result is the same as a serial load. Only one chunk per
+worker is in flight at a time, so parsed chunks waiting
+to be merged never add up to a second copy of the data.
+"""
+import csv
+import io
+import mmap
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import List, Optional, Tuple
+
+ColumnarServer = __import__('4-columnar_pagination').Server
+ColumnarDataset = __import__('4-columnar_pagination').ColumnarDataset
+scan_rows = __import__('5-mmap_pagination').scan_rows
+
+CHUNK_SIZE = 1 << 24
+
+
+def split(path: str, chunks: int) -> Tuple[List[str], List[int]]:
+    """
+    Returns the header of a CSV file and the offsets that
+    cut its records into about chunks equal parts, from
+    the first record to the end of the file.
+
+    Parts are cut at the first line break after each even
+    split point, unless the file contains quotes, in which
+    case the records are scanned so that no quoted line
+    break is cut.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return [], [0]
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            end = data.find(b"\n") + 1 or len(data)
+            header = next(csv.reader(io.StringIO(data[:end].decode())), [])
+            if data.find(b'"') != -1:
+                records = scan_rows(data)[1:]
+                step = max(1, (len(records) - 1) // chunks)
+                return header, list(records[:-1:step]) + [len(data)]
+            offsets = [end]
+            for i in range(1, chunks):
+                cut = data.find(b"\n", end + (len(data) - end) * i // chunks)
+                if cut != -1 and cut + 1 > offsets[-1]:
+                    offsets.append(cut + 1)
+            if offsets[-1] < len(data):
+                offsets.append(len(data))
+            return header, offsets
+
+
+def parse_chunk(path: str, start: int, end: int) -> ColumnarDataset:
+    """
+    Parses the records between two offsets of a CSV file.
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode()
+    return ColumnarDataset.from_rows([], csv.reader(io.StringIO(text)))
+
+
+def load_parallel(path: str, workers: Optional[int] = None,
+                  chunk_size: int = CHUNK_SIZE) -> ColumnarDataset:
+    """
+    Loads a CSV file into a ColumnarDataset using a pool
+    of processes.
+
+    Args:
+        path (str): The CSV file, whose first line is the
+            header.
+        workers (int): Number of processes, defaults to the
+            number of CPUs.
+        chunk_size (int): Approximate bytes per chunk; files
+            smaller than two chunks are parsed in-process.
+
+    Returns:
+        ColumnarDataset: The dataset, identical to the one
+        ColumnarDataset.from_csv would load.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = max(1, min(4 * workers, os.path.getsize(path) // chunk_size))
+    if chunks == 1 or workers == 1:
+        return ColumnarDataset.from_csv(path)
+    header, offsets = split(path, chunks)
+    dataset = ColumnarDataset(header)
+    bounds = iter(zip(offsets[:-1], offsets[1:]))
+    with ProcessPoolExecutor(workers) as pool:
+        window = deque(pool.submit(parse_chunk, path, start, end)
+                       for start, end in islice(bounds, workers))
+        while window:
+            chunk = window.popleft().result()
+            for start, end in islice(bounds, 1):
+                window.append(pool.submit(parse_chunk, path, start, end))
+            dataset.merge(chunk)
+            del chunk
+    return dataset
+
+
+class Server(ColumnarServer):
+    """
+    Server class to paginate a database of popular baby
+    names loaded by several processes.
+
+    Attributes:
+        workers (int): Number of loading processes.
+        chunk_size (int): Approximate bytes per chunk.
+    """
+    def __init__(self, workers: Optional[int] = None,
+                 chunk_size: int = CHUNK_SIZE):
+        """
+        Initializes a new Server instance, setting the
+        dataset to None initially.
+        """
+        super().__init__()
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.__loaded = None
+
+    def dataset(self) -> ColumnarDataset:
+        """
+        Loads and caches the dataset from the CSV file in
+        parallel if not already loaded.
+
+        Returns:
+            ColumnarDataset: The loaded dataset excluding the
+            header.
+        """
+        if self.__loaded is None:
+            try:
+                self.__loaded = load_parallel(self.DATA_FILE, self.workers,
+                                              self.chunk_size)
+            except FileNotFoundError:
+                print("Error: Data file not found.")
+                self.__loaded = ColumnarDataset([])
+        return self.__loaded
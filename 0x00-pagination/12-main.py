@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+import os
+import shutil
+import tempfile
+import time
+
+Server = __import__('12-sidecar_pagination').Server
+ColumnarServer = __import__('4-columnar_pagination').Server
+
+copy = os.path.join(tempfile.mkdtemp(), "names.csv")
+shutil.copy(Server.DATA_FILE, copy)
+
+timings = []
+for _ in range(2):
+    server = Server()
+    server.DATA_FILE = copy
+    start = time.perf_counter()
+    server.dataset()
+    timings.append(time.perf_counter() - start)
+    print(type(server.dataset()).__name__, os.path.exists(copy + ".bin"))
+print("parse {:.1f} ms, sidecar {:.1f} ms".format(
+    timings[0] * 1000, timings[1] * 1000))
+
+print(server.get_page(1, 3))
+print(server.get_hyper(1942, 10)["data"][-1])
+reference = ColumnarServer()
+print(all(server.get_page(page, 100) == reference.get_page(page, 100)
+          for page in range(1, 196)))
+
+with open(copy, "a") as f:
+    f.write("2017,FEMALE,HISPANIC,Ada,10,1\n")
+server = Server()
+server.DATA_FILE = copy
+print(type(server.dataset()).__name__, len(server.dataset()))
+server = Server()
+server.DATA_FILE = copy
+print(type(server.dataset()).__name__, server.get_page(19419, 1))
+shutil.rmtree(os.path.dirname(copy))
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""Binary sidecar pagination.
+
+This module provides a Server that saves the columnar
+dataset of the CSV file to a versioned binary sidecar
+after the first parse, and maps the sidecar instead of
+parsing on later starts.
+
+The sidecar holds a header, stamped with the size and
+modification time of the CSV, a table of sections, and
+8-byte aligned sections: the integer and code columns as
+raw arrays, the header, distinct values and verbatim
+fields as string tables, and the row-offset index of
+task 5. Loaded columns are memoryviews of the mapping,
+so a start costs decoding the string tables only. A
+stale or unreadable sidecar is rebuilt from the CSV.
+"""
+import csv
+import io
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+columnar = __import__('4-columnar_pagination')
+scan_rows = __import__('5-mmap_pagination').scan_rows
+ColumnarServer = columnar.Server
+ColumnarDataset = columnar.ColumnarDataset
+IntColumn = columnar.IntColumn
+CodedColumn = columnar.CodedColumn
+
+SIDECAR_MAGIC = b"ALXNAMES"
+SIDECAR_VERSION = 1
+SIDECAR_SUFFIX = ".bin"
+HEADER = struct.Struct("<8sIQQI")
+SECTION = struct.Struct("<ccH4xQQ")
+COLUMN_HEADER, COLUMN_OFFSETS = 0xFFFF, 0xFFFE
+
+
+def pack_strings(strings: List[str]) -> bytes:
+    """
+    Encodes strings as a table: their count, the end
+    offset of each one, then their UTF-8 bytes.
+    """
+    blobs = [text.encode() for text in strings]
+    ends = array("I", [len(blobs)])
+    total = 0
+    for blob in blobs:
+        total += len(blob)
+        ends.append(total)
+    return ends.tobytes() + b"".join(blobs)
+
+
+def unpack_strings(data: memoryview) -> List[str]:
+    """
+    Decodes a table written by pack_strings.
+    """
+    count = data[:4].cast("I")[0]
+    ends = data[4:4 * (count + 1)].cast("I")
+    blob = bytes(data[4 * (count + 1):])
+    start, strings = 0, []
+    for end in ends:
+        strings.append(sys.intern(blob[start:end].decode()))
+        start = end
+    return strings
+
+
+class SidecarDataset(ColumnarDataset):
+    """
+    Read-only columnar dataset whose columns are views of
+    a mapped sidecar file.
+
+    Attributes:
+        map (mmap.mmap): The mapped sidecar.
+        offsets (memoryview): The offset of each CSV record,
+            the header first, followed by the end of the
+            last one.
+    """
+    def __init__(self, header: List[str], columns: List,
+                 sidecar: mmap.mmap, offsets: memoryview):
+        """
+        Initializes a dataset over a mapped sidecar.
+        """
+        super().__init__(header, columns)
+        self.map = sidecar
+        self.offsets = offsets
+
+
+def write_sidecar(path: str, dataset: ColumnarDataset,
+                  offsets: array, stat: os.stat_result) -> None:
+    """
+    Writes the sidecar of a dataset parsed from a CSV file
+    with the given stat, replacing the file atomically.
+    """
+    sections = [(b"H", b"B", COLUMN_HEADER, pack_strings(dataset.header)),
+                (b"O", b"Q", COLUMN_OFFSETS, offsets.tobytes())]
+    for i, column in enumerate(dataset.columns):
+        if isinstance(column, IntColumn):
+            rows = sorted(column.raw)
+            sections += [
+                (b"I", b"i", i, column.values.tobytes()),
+                (b"r", b"I", i, array("I", rows).tobytes()),
+                (b"R", b"B", i, pack_strings([column.raw[row]
+                                              for row in rows])),
+            ]
+        else:
+            typecode = column.codes.typecode.encode()
+            sections += [
+                (b"C", typecode, i, column.codes.tobytes()),
+                (b"V", b"B", i, pack_strings(column.values)),
+            ]
+    position = HEADER.size + SECTION.size * len(sections)
+    table, padded = [], []
+    for kind, typecode, column, data in sections:
+        position += -position % 8
+        table.append(SECTION.pack(kind, typecode, column, position,
+                                  len(data)))
+        padded.append(data)
+        position += len(data)
+    fd, temp = tempfile.mkstemp(dir=os.path.dirname(path) or os.curdir,
+                                prefix=os.path.basename(path) + ".",
+                                suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(HEADER.pack(SIDECAR_MAGIC, SIDECAR_VERSION, stat.st_size,
+                                stat.st_mtime_ns, len(sections)))
+            f.write(b"".join(table))
+            for data in padded:
+                f.write(bytes(-f.tell() % 8))
+                f.write(data)
+        os.replace(temp, path)
+    except BaseException:
+        try:
+            os.remove(temp)
+        except OSError:
+            pass
+        raise
+
+
+def read_sidecar(path: str,
+                 stat: os.stat_result) -> Optional[SidecarDataset]:
+    """
+    Maps the sidecar of a CSV file with the given stat.
+
+    Returns:
+        SidecarDataset: The dataset, or None if the sidecar
+        is missing, of another version, stale or corrupt.
+    """
+    try:
+        with open(path, "rb") as f:
+            sidecar = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    try:
+        magic, version, size, mtime, count = HEADER.unpack_from(sidecar)
+        if (magic, version, size, mtime) != (
+                SIDECAR_MAGIC, SIDECAR_VERSION,
+                stat.st_size, stat.st_mtime_ns):
+            raise ValueError("stale sidecar")
+        view = memoryview(sidecar)
+        sections: Dict[Tuple[bytes, int], memoryview] = {}
+        for i in range(count):
+            kind, typecode, column, offset, length = SECTION.unpack_from(
+                sidecar, HEADER.size + i * SECTION.size)
+            if offset + length > len(sidecar):
+                raise ValueError("section out of bounds")
+            sections[kind, column] = view[offset:offset + length].cast(
+                typecode.decode())
+        columns = []
+        for i, kind in enumerate(columnar.SCHEMA):
+            column = kind()
+            if kind is IntColumn:
+                column.values = sections[b"I", i]
+                column.raw = dict(zip(sections[b"r", i],
+                                      unpack_strings(sections[b"R", i])))
+            else:
+                column.codes = sections[b"C", i]
+                column.values = unpack_strings(sections[b"V", i])
+                column.lookup = {text: code for code, text
+                                 in enumerate(column.values)}
+            columns.append(column)
+        header = unpack_strings(sections[b"H", COLUMN_HEADER])
+        offsets = sections[b"O", COLUMN_OFFSETS]
+        rows = len(columns[0])
+        for column in columns:
+            if isinstance(column, IntColumn):
+                outside = max(column.raw, default=-1) >= rows
+            else:
+                outside = max(column.codes, default=-1) >= len(column.values)
+            if len(column) != rows or outside:
+                raise ValueError("inconsistent sidecar")
+        if len(offsets) != rows + 2:
+            raise ValueError("inconsistent sidecar")
+        return SidecarDataset(header, columns, sidecar, offsets)
+    except (KeyError, IndexError, ValueError, TypeError, struct.error):
+        return None
+
+
+class Server(ColumnarServer):
+    """
+    Server class to paginate a database of popular baby
+    names, starting from a binary sidecar when it is
+    up to date.
+    """
+    def __init__(self):
+        """
+        Initializes a new Server instance, setting the
+        dataset to None initially.
+        """
+        super().__init__()
+        self.__loaded = None
+
+    def dataset(self) -> ColumnarDataset:
+        """
+        Maps the sidecar, or parses the CSV file and writes
+        the sidecar, if not already loaded.
+
+        Returns:
+            ColumnarDataset: The loaded dataset excluding the
+            header.
+        """
+        if self.__loaded is None:
+            try:
+                sidecar = self.DATA_FILE + SIDECAR_SUFFIX
+                with open(self.DATA_FILE, "rb") as f:
+                    stat = os.fstat(f.fileno())
+                    self.__loaded = read_sidecar(sidecar, stat)
+                    if self.__loaded is None:
+                        data = f.read()
+                        reader = csv.reader(io.StringIO(data.decode()))
+                        self.__loaded = ColumnarDataset.from_rows(
+                            next(reader, []), reader)
+                        try:
+                            write_sidecar(sidecar, self.__loaded,
+                                          scan_rows(data), stat)
+                        except OSError as e:
+                            print(f"Error writing sidecar: {e}")
+            except FileNotFoundError:
+                print("Error: Data file not found.")
+                self.__loaded = ColumnarDataset([])
+        return self.__loaded
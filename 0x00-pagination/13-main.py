@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+import tracemalloc
+
+Server = __import__('13-tombstone_pagination').Server
+
+tracemalloc.start()
+server = Server()
+print(len(server.dataset()), server.tombstones())
+
+res = server.get_hyper_index(3, 2)
+print(res)
+print(server.delete(res['index']), server.delete(res['index']))
+print(server.get_hyper_index(res['index'], 2))
+
+print(server.delete_many(range(100, 5100)), server.tombstones())
+if server.compactor is not None:
+    server.compactor.join()
+print(len(server.dataset()), server.tombstones())
+print(server.get_hyper_index(99, 3))
+print(server.get_hyper(1, 4)['data'] == server.get_hyper_index(0, 4)['data'])
+
+before = tracemalloc.get_traced_memory()[0]
+server.delete_many(range(5100, 19000))
+if server.compactor is not None:
+    server.compactor.join()
+print(len(server.dataset()), server.tombstones(), server.compact())
+print("freed {:.0f} KiB".format(
+    (before - tracemalloc.get_traced_memory()[0]) / 1024))
+print(server.get_hyper_index(99, 3)['next_index'])
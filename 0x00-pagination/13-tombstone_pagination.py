@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""Tombstone deletion pagination.
+
+This module provides a Server with delete and
+delete_many, which mark rows of the columnar dataset as
+deleted in the LiveIndex of task 6 instead of removing
+them, so a deletion costs O(log n) and get_hyper_index
+keeps counting cursors in original row indexes. Once
+deleted rows make up more than compact_ratio of the
+stored ones, a background thread copies the remaining
+rows into a smaller dataset and swaps it in, replaying
+the deletions made while it was copying. Cursors stay
+valid across compactions.
+"""
+import math
+import threading
+from array import array
+from bisect import bisect_left
+from itertools import compress
+from typing import Dict, Iterable, List, Tuple
+
+index_range = __import__('0-simple_helper_function').index_range
+ColumnarServer = __import__('4-columnar_pagination').Server
+ColumnarDataset = __import__('4-columnar_pagination').ColumnarDataset
+LiveIndex = __import__('6-indexed_del_pagination').LiveIndex
+
+COMPACT_RATIO = 0.25
+
+State = Tuple[ColumnarDataset, array, LiveIndex]
+
+
+class Server(ColumnarServer):
+    """
+    Server class to paginate a database of popular baby
+    names, resilient to deletions, that compacts deleted
+    rows away in the background.
+
+    Attributes:
+        compact_ratio (float): The share of deleted rows
+            above which a compaction starts.
+        compactor (threading.Thread): The running
+            compaction, if any.
+    """
+    def __init__(self, compact_ratio: float = COMPACT_RATIO):
+        """
+        Initializes a new Server instance, setting the
+        state to None initially.
+        """
+        super().__init__()
+        self.compact_ratio = compact_ratio
+        self.compactor = None
+        self.__state = None
+        self.__pending = None
+        self.__lock = threading.Lock()
+
+    def state(self) -> State:
+        """
+        Returns the stored rows, the original index of each
+        one and the index of those not deleted, loading the
+        file on first use.
+        """
+        if self.__state is None:
+            try:
+                dataset = ColumnarDataset.from_csv(self.DATA_FILE)
+            except FileNotFoundError:
+                print("Error: Data file not found.")
+                dataset = ColumnarDataset([])
+            self.__state = (dataset, array("I", range(len(dataset))),
+                            LiveIndex(range(len(dataset)), len(dataset)))
+        return self.__state
+
+    def dataset(self) -> ColumnarDataset:
+        """
+        Returns the stored rows, including those deleted
+        since the last compaction.
+
+        Returns:
+            ColumnarDataset: The stored dataset excluding the
+            header.
+        """
+        return self.state()[0]
+
+    def tombstones(self) -> int:
+        """
+        Returns the number of deleted rows still stored.
+        """
+        with self.__lock:
+            dataset, ids, live = self.state()
+            return len(ids) - len(live)
+
+    def __delete(self, index: int) -> bool:
+        """
+        Marks the row at an original index as deleted, with
+        the lock held.
+        """
+        dataset, ids, live = self.state()
+        position = bisect_left(ids, index)
+        if position == len(ids) or ids[position] != index or \
+                position not in live:
+            return False
+        live.discard(position)
+        if self.__pending is not None:
+            self.__pending.append(index)
+        return True
+
+    def __collect(self) -> None:
+        """
+        Starts a background compaction if enough rows are
+        deleted and none is running, with the lock held.
+        """
+        dataset, ids, live = self.state()
+        if self.__pending is None and \
+                len(ids) - len(live) > self.compact_ratio * len(ids):
+
+            def collect():
+                """ Compaction thread """
+                try:
+                    self.compact()
+                except Exception as e:
+                    print(f"Error in compaction: {e}")
+
+            self.compactor = threading.Thread(target=collect, daemon=True)
+            self.compactor.start()
+
+    def delete(self, index: int) -> bool:
+        """
+        Deletes the row at an original index.
+
+        Args:
+            index (int): The index of the row in the file,
+                not counting deleted rows out.
+
+        Returns:
+            bool: Whether the row was present.
+        """
+        assert type(index) == int, "Index must be an integer."
+        with self.__lock:
+            deleted = self.__delete(index)
+            if deleted:
+                self.__collect()
+            return deleted
+
+    def delete_many(self, indexes: Iterable[int]) -> int:
+        """
+        Deletes the rows at several original indexes.
+
+        Args:
+            indexes (Iterable[int]): The indexes of the rows.
+
+        Returns:
+            int: The number of rows that were present.
+        """
+        indexes = list(indexes)
+        assert all(type(index) == int for index in indexes), \
+            "Indexes must be integers."
+        with self.__lock:
+            count = sum(self.__delete(index) for index in indexes)
+            if count:
+                self.__collect()
+            return count
+
+    def compact(self) -> bool:
+        """
+        Copies the rows not deleted into a new dataset and
+        swaps it in. Deletions are not blocked while the
+        rows are copied.
+
+        Returns:
+            bool: Whether a compaction was done; False if no
+            row is deleted or another one is running.
+        """
+        with self.__lock:
+            dataset, ids, live = self.state()
+            if self.__pending is not None or len(live) == len(ids):
+                return False
+            self.__pending = []
+            bits = bytes(live.bits[:len(ids)])
+        try:
+            keep = list(compress(range(len(bits)), bits))
+            state = (dataset.take(keep),
+                     array("I", map(ids.__getitem__, keep)),
+                     LiveIndex(range(len(keep)), len(keep)))
+        except BaseException:
+            with self.__lock:
+                self.__pending = None
+            raise
+        with self.__lock:
+            pending, self.__pending = self.__pending, None
+            self.__state = state
+            for index in pending:
+                self.__delete(index)
+        return True
+
+    def get_page(self, page: int = 1, page_size: int = 10) -> List[List]:
+        """
+        Retrieves a page of the rows not deleted.
+
+        Args:
+            page (int): The page number (1-indexed).
+            page_size (int): The number of items per page.
+
+        Returns:
+            List[List]: A list of rows for the specified page.
+
+        Raises:
+            AssertionError: If page or page_size is not a
+            positive integer.
+        """
+        assert type(page) == int and type(page_size) == int, \
+            "Page and page size must be integers."
+        assert page > 0 and page_size > 0, \
+            "Page and page size must be positive."
+
+        start, end = index_range(page, page_size)
+        with self.__lock:
+            dataset, ids, live = self.state()
+            return [dataset.row(live.select(k))
+                    for k in range(start, min(end, len(live)))]
+
+    def get_hyper(self, page: int = 1, page_size: int = 10) -> Dict:
+        """
+        Retrieves information about a page of the rows not
+        deleted, including data and pagination details.
+
+        Args:
+            page (int): The page number (1-indexed).
+            page_size (int): The number of items per page.
+
+        Returns:
+            Dict: A dictionary with page size, page number,
+            data, next page, previous page, and total pages.
+        """
+        assert type(page) == int and type(page_size) == int, \
+            "Page and page size must be integers."
+        assert page > 0 and page_size > 0, \
+            "Page and page size must be positive."
+
+        start, end = index_range(page, page_size)
+        with self.__lock:
+            dataset, ids, live = self.state()
+            total = len(live)
+            page_data = [dataset.row(live.select(k))
+                         for k in range(start, min(end, total))]
+        return {
+            'page_size': len(page_data),
+            'page': page,
+            'data': page_data,
+            'next_page': page + 1 if end < total else None,
+            'prev_page': page - 1 if start > 0 else None,
+            'total_pages': math.ceil(total / page_size),
+        }
+
+    def get_hyper_index(self, index: int = None, page_size: int = 10) -> Dict:
+        """
+        Retrieves information about a page from a given
+        original index and with a specified size, in
+        O(page_size * log n).
+
+        Args:
+            index (int): The starting index of the data.
+            page_size (int): The number of items per page.
+
+        Returns:
+            Dict: A dictionary with index, next index, page
+            size, and data.
+
+        Raises:
+            AssertionError: If index is not a valid position
+            in the dataset.
+        """
+        with self.__lock:
+            dataset, ids, live = self.state()
+            assert index is not None and len(live) and \
+                0 <= index <= ids[live.select(len(live) - 1)]
+            first = live.rank(bisect_left(ids, index))
+            last = min(first + page_size, len(live))
+            page_data = [dataset.row(live.select(k))
+                         for k in range(first, last)]
+            next_index = ids[live.select(last)] if last < len(live) else None
+        return {
+            'index': index,
+            'next_index': next_index,
+            'page_size': len(page_data),
+            'data': page_data,
+        }
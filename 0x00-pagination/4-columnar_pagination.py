@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""Columnar pagination.
+
+This module provides a ColumnarDataset class that stores
+the popular baby names as typed columns instead of a list
+of lists of strings: integer arrays for the year, count
+and rank, and dictionary-encoded columns for the gender,
+ethnicity and first name, whose distinct values are
+interned once. Rows are only built, as lists of strings
+identical to the CSV fields, when a page asks for them.
+"""
+import csv
+import math
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import Dict, Iterable, List, Union
+
+index_range = __import__('0-simple_helper_function').index_range
+
+CODE_TYPES = ("B", "H", "I")
+
+
+class IntColumn:
+    """
+    Column of integers kept in an array.
+
+    Attributes:
+        values (array): The value of each row.
+        raw (Dict[int, str]): Fields that are not the
+            canonical text of an integer (such as "9i7" or
+            "007"), kept verbatim by row.
+    """
+    def __init__(self, values: Iterable[int] = ()):
+        """
+        Initializes the column.
+        """
+        self.values = array("i", values)
+        self.raw = {}
+
+    def __len__(self) -> int:
+        """
+        Returns the number of rows.
+        """
+        return len(self.values)
+
+    def append(self, text: str) -> None:
+        """
+        Appends the field of a new row.
+        """
+        try:
+            value = int(text)
+            if str(value) != text:
+                raise ValueError(text)
+            self.values.append(value)
+        except (ValueError, OverflowError):
+            self.raw[len(self.values)] = text
+            self.values.append(0)
+
+    def copy(self) -> "IntColumn":
+        """
+        Returns a copy that can be extended independently.
+        """
+        column = IntColumn()
+        column.values = array("i", self.values)
+        column.raw = dict(self.raw)
+        return column
+
+    def merge(self, other: "IntColumn") -> None:
+        """
+        Appends the rows of another column.
+        """
+        shift = len(self.values)
+        self.raw.update((row + shift, text) for row, text in other.raw.items())
+        self.values.extend(other.values)
+
+    def take(self, rows: List[int]) -> "IntColumn":
+        """
+        Returns a new column holding the given rows, in order.
+        """
+        column = IntColumn(map(self.values.__getitem__, rows))
+        if self.raw:
+            column.raw = {i: self.raw[row] for i, row in enumerate(rows)
+                          if row in self.raw}
+        return column
+
+    def text(self, row: int) -> str:
+        """
+        Returns the field of a row as it appears in the CSV.
+        """
+        if self.raw:
+            text = self.raw.get(row)
+            if text is not None:
+                return text
+        return str(self.values[row])
+
+
+class CodedColumn:
+    """
+    Column of strings stored as codes into a table of
+    distinct values.
+
+    Attributes:
+        codes (array): The code of each row, widened from
+            one to four bytes as distinct values are added.
+        values (List[str]): The interned distinct values.
+        lookup (Dict[str, int]): The code of each value.
+    """
+    def __init__(self):
+        """
+        Initializes the column.
+        """
+        self.codes = array(CODE_TYPES[0])
+        self.values = []
+        self.lookup = {}
+
+    def __len__(self) -> int:
+        """
+        Returns the number of rows.
+        """
+        return len(self.codes)
+
+    def encode(self, text: str) -> int:
+        """
+        Returns the code of a value, adding it if new.
+        """
+        code = self.lookup.get(text)
+        if code is None:
+            code = len(self.values)
+            if code >= 1 << (8 * self.codes.itemsize):
+                wider = CODE_TYPES[CODE_TYPES.index(self.codes.typecode) + 1]
+                self.codes = array(wider, self.codes)
+            self.values.append(sys.intern(text))
+            self.lookup[text] = code
+        return code
+
+    def append(self, text: str) -> None:
+        """
+        Appends the field of a new row.
+        """
+        code = self.encode(text)
+        self.codes.append(code)
+
+    def copy(self) -> "CodedColumn":
+        """
+        Returns a copy that can be extended independently.
+        """
+        column = CodedColumn()
+        column.codes = array(self.codes.typecode, self.codes)
+        column.values = list(self.values)
+        column.lookup = dict(self.lookup)
+        return column
+
+    def merge(self, other: "CodedColumn") -> None:
+        """
+        Appends the rows of another column, translating its
+        codes into codes of this column.
+        """
+        table = [self.encode(text) for text in other.values]
+        self.codes.extend(map(table.__getitem__, other.codes))
+
+    def take(self, rows: List[int]) -> "CodedColumn":
+        """
+        Returns a new column holding the given rows, in order,
+        with the same codes.
+        """
+        column = CodedColumn()
+        column.codes = array(self.codes.typecode,
+                             map(self.codes.__getitem__, rows))
+        column.values = list(self.values)
+        column.lookup = dict(self.lookup)
+        return column
+
+    def text(self, row: int) -> str:
+        """
+        Returns the field of a row.
+        """
+        return self.values[self.codes[row]]
+
+
+SCHEMA = (IntColumn, CodedColumn, CodedColumn, CodedColumn,
+          IntColumn, IntColumn)
+
+
+class ColumnarDataset(Sequence):
+    """
+    Read-only sequence of the dataset rows backed by
+    typed columns.
+
+    Attributes:
+        header (List[str]): The column names.
+        columns (List): One IntColumn or CodedColumn per
+            column, in header order.
+    """
+    def __init__(self, header: List[str], columns: List = None):
+        """
+        Initializes a dataset, empty unless columns are given.
+        """
+        self.header = header
+        self.columns = columns or [kind() for kind in SCHEMA]
+
+    @classmethod
+    def from_rows(cls, header: List[str],
+                  rows: Iterable[List[str]]) -> "ColumnarDataset":
+        """
+        Builds a dataset from rows of strings.
+        """
+        dataset = cls(header)
+        dataset.extend(rows)
+        return dataset
+
+    @classmethod
+    def from_csv(cls, path: str) -> "ColumnarDataset":
+        """
+        Parses a CSV file whose first line is the header.
+        """
+        with open(path) as f:
+            reader = csv.reader(f)
+            return cls.from_rows(next(reader, []), reader)
+
+    def extend(self, rows: Iterable[List[str]]) -> None:
+        """
+        Appends rows of strings, column by column.
+
+        Raises:
+            ValueError: If a row does not have one field per
+            column; the rows before it are kept.
+        """
+        appends = [column.append for column in self.columns]
+        for row in rows:
+            if len(row) != len(appends):
+                raise ValueError("Row {} has {} fields, expected {}.".format(
+                    len(self), len(row), len(appends)))
+            for append, field in zip(appends, row):
+                append(field)
+
+    def copy(self) -> "ColumnarDataset":
+        """
+        Returns a copy that can be extended independently.
+        """
+        return ColumnarDataset(list(self.header),
+                               [column.copy() for column in self.columns])
+
+    def merge(self, other: "ColumnarDataset") -> None:
+        """
+        Appends the rows of another dataset, column by column.
+        """
+        for column, rows in zip(self.columns, other.columns):
+            column.merge(rows)
+
+    def take(self, rows: Iterable[int]) -> "ColumnarDataset":
+        """
+        Returns a new dataset holding the given rows, in order.
+        """
+        rows = list(rows)
+        return ColumnarDataset(self.header,
+                               [column.take(rows) for column in self.columns])
+
+    def __len__(self) -> int:
+        """
+        Returns the number of rows.
+        """
+        return len(self.columns[0])
+
+    def row(self, index: int) -> List[str]:
+        """
+        Builds one row as a list of strings.
+        """
+        return [column.text(index) for column in self.columns]
+
+    def __getitem__(self, index: Union[int, slice]) -> List:
+        """
+        Builds a row, or the list of rows of a slice.
+        """
+        if isinstance(index, slice):
+            return [self.row(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("dataset index out of range")
+        return self.row(index)
+
+
+class Server:
+    """
+    Server class to paginate a database of popular baby
+    names held in typed columns.
+
+    Attributes:
+        DATA_FILE (str): The file path to the dataset.
+        __dataset (ColumnarDataset): Cached dataset after
+            loading from the file.
+    """
+    DATA_FILE = "Popular_Baby_Names.csv"
+
+    def __init__(self):
+        """
+        Initializes a new Server instance, setting the
+        dataset to None initially.
+        """
+        self.__dataset = None
+
+    def dataset(self) -> ColumnarDataset:
+        """
+        Loads and caches the dataset from the CSV file if
+        not already loaded.
+
+        Returns:
+            ColumnarDataset: The loaded dataset excluding the
+            header.
+        """
+        if self.__dataset is None:
+            try:
+                self.__dataset = ColumnarDataset.from_csv(self.DATA_FILE)
+            except FileNotFoundError:
+                print("Error: Data file not found.")
+                self.__dataset = ColumnarDataset([])
+        return self.__dataset
+
+    def get_page(self, page: int = 1, page_size: int = 10) -> List[List]:
+        """
+        Retrieves a page of data from the dataset, building
+        only its rows.
+
+        Args:
+            page (int): The page number (1-indexed).
+            page_size (int): The number of items per page.
+
+        Returns:
+            List[List]: A list of rows for the specified page.
+
+        Raises:
+            AssertionError: If page or page_size is not a
+            positive integer.
+        """
+        assert type(page) == int and type(page_size) == int, \
+            "Page and page size must be integers."
+        assert page > 0 and page_size > 0, \
+            "Page and page size must be positive."
+
+        start, end = index_range(page, page_size)
+        data = self.dataset()
+        if start >= len(data):
+            return []
+        return data[start:end]
+
+    def get_hyper(self, page: int = 1, page_size: int = 10) -> Dict:
+        """
+        Retrieves information about a page, including data
+        and pagination details.
+
+        Args:
+            page (int): The page number (1-indexed).
+            page_size (int): The number of items per page.
+
+        Returns:
+            Dict: A dictionary with page size, page number,
+            data, next page, previous page, and total pages.
+        """
+        page_data = self.get_page(page, page_size)
+        start, end = index_range(page, page_size)
+        total = len(self.dataset())
+        return {
+            'page_size': len(page_data),
+            'page': page,
+            'data': page_data,
+            'next_page': page + 1 if end < total else None,
+            'prev_page': page - 1 if start > 0 else None,
+            'total_pages': math.ceil(total / page_size),
+        }
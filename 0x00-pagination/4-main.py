@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+import tracemalloc
+
+Server = __import__('4-columnar_pagination').Server
+RowServer = __import__('2-hypermedia_pagination').Server
+
+server = Server()
+row_server = RowServer()
+
+print(server.get_page(1, 3))
+print(server.get_hyper(2, 2))
+print(server.get_hyper(3000, 100))
+print(server.get_page(1942, 10)[-1])
+print(all(server.get_page(page, 100) == row_server.get_page(page, 100)
+          for page in range(1, 196)))
+
+for name, new in (("rows", RowServer), ("columns", Server)):
+    tracemalloc.start()
+    loaded = new()
+    loaded.dataset()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("{}: {} KiB".format(name, size // 1024))
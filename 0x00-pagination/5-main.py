@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+import os
+import time
+
+Server = __import__('5-mmap_pagination').Server
+
+start = time.perf_counter()
+server = Server()
+print(server.get_page(1, 3))
+first = time.perf_counter() - start
+print(server.get_hyper(3, 2))
+print(server.get_hyper(3000, 100))
+print(server.get_page(1942, 10)[-1])
+print(os.path.exists(Server.DATA_FILE + ".idx"))
+
+loaded = Server(mapped=False)
+print(all(server.get_page(page, 100) == loaded.get_page(page, 100)
+          for page in range(1, 196)))
+
+start = time.perf_counter()
+Server().get_page(1, 3)
+print("cold {:.1f} ms, indexed {:.1f} ms".format(
+    first * 1000, (time.perf_counter() - start) * 1000))
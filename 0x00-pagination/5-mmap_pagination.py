@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""Memory-mapped pagination.
+
+This module provides a MappedDataset class that serves
+rows straight from a memory-mapped CSV file. A one-time
+scan records the byte offset of every row and saves it
+beside the file, so later opens only read that index,
+and a page only parses the bytes of its own rows. Time
+to first page and memory stay almost constant however
+large the file is.
+"""
+import csv
+import io
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from collections.abc import Sequence
+from itertools import accumulate, chain, islice
+from typing import List, Union
+
+ColumnarServer = __import__('4-columnar_pagination').Server
+
+INDEX_MAGIC = b"ALXROWIX"
+INDEX_VERSION = 1
+INDEX_HEADER = struct.Struct("<8sIQQ")
+BLOCK_SIZE = 1 << 24
+
+
+def scan_rows(data: bytes, start: int = 0) -> array:
+    """
+    Returns the offsets of the CSV records of data from
+    start, followed by the end of the last record.
+
+    Lines are split in large blocks without looking at the
+    fields. Only when the data contains quotes are the
+    quotes counted line by line, so that a quoted field
+    spanning lines stays in one record.
+    """
+    size = len(data)
+    offsets = array("Q", [start])
+    quoted = data.find(b'"', start) != -1
+    pending = False
+    while start < size:
+        end = data.rfind(b"\n", start, start + BLOCK_SIZE) + 1
+        if end <= start:
+            end = data.find(b"\n", start + BLOCK_SIZE)
+            end = size if end == -1 else end + 1
+        lines = data[start:end].splitlines(keepends=True)
+        if not quoted:
+            ends = accumulate(chain([start], map(len, lines)))
+            offsets.extend(islice(ends, 1, None))
+        else:
+            for line in lines:
+                start += len(line)
+                if line.count(b'"') % 2:
+                    pending = not pending
+                if not pending:
+                    offsets.append(start)
+        start = end
+    return offsets
+
+
+class MappedDataset(Sequence):
+    """
+    Read-only sequence of the rows of a memory-mapped CSV
+    file, whose first line is the header.
+
+    Attributes:
+        path (str): The CSV file.
+        offsets (array): The offset of each row, followed by
+            the end of the last row.
+        header (List[str]): The column names.
+    """
+    def __init__(self, path: str):
+        """
+        Maps the file and loads its row index, building and
+        saving the index when missing or stale.
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            self.map = b""
+            if stat.st_size:
+                self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.offsets = self.__load_index(stat)
+        if self.offsets is None:
+            self.offsets = scan_rows(self.map)
+            self.__save_index(stat)
+        self.header = self.__parse(0, 1)[0] if len(self.offsets) > 1 else []
+
+    def __load_index(self, stat: os.stat_result) -> Union[array, None]:
+        """
+        Reads the saved row index if it matches the size and
+        modification time of the file.
+        """
+        try:
+            with open(self.path + ".idx", "rb") as f:
+                header = f.read(INDEX_HEADER.size)
+                magic, version, size, mtime = INDEX_HEADER.unpack(header)
+                if (magic, version, size, mtime) != (
+                        INDEX_MAGIC, INDEX_VERSION,
+                        stat.st_size, stat.st_mtime_ns):
+                    return None
+                offsets = array("Q")
+                offsets.frombytes(f.read())
+                return offsets
+        except (OSError, struct.error, ValueError):
+            return None
+
+    def __save_index(self, stat: os.stat_result) -> None:
+        """
+        Saves the row index beside the file, if writable.
+        """
+        try:
+            fd, temp = tempfile.mkstemp(
+                dir=os.path.dirname(self.path) or os.curdir,
+                prefix=os.path.basename(self.path) + ".", suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION,
+                                          stat.st_size, stat.st_mtime_ns))
+                self.offsets.tofile(f)
+            os.replace(temp, self.path + ".idx")
+        except OSError:
+            try:
+                os.remove(temp)
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        """
+        Unmaps the file.
+        """
+        if isinstance(self.map, mmap.mmap):
+            self.map.close()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of rows, excluding the header.
+        """
+        return max(0, len(self.offsets) - 2)
+
+    def __parse(self, first: int, last: int) -> List[List[str]]:
+        """
+        Parses the records first to last of the file, where
+        record 0 is the header.
+        """
+        text = self.map[self.offsets[first]:self.offsets[last]].decode()
+        return list(csv.reader(io.StringIO(text)))
+
+    def __getitem__(self, index: Union[int, slice]) -> List:
+        """
+        Parses a row, or the rows of a contiguous slice.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            if start >= stop:
+                return []
+            return self.__parse(start + 1, stop + 1)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("dataset index out of range")
+        return self.__parse(index + 1, index + 2)[0]
+
+
+class Server(ColumnarServer):
+    """
+    Server class to paginate a database of popular baby
+    names, by default without loading it.
+
+    Attributes:
+        mapped (bool): Whether rows are read from the mapped
+            file rather than loaded in columns.
+    """
+    def __init__(self, mapped: bool = True):
+        """
+        Initializes a new Server instance in mapped or
+        loaded mode.
+        """
+        super().__init__()
+        self.mapped = mapped
+        self.__mapped = None
+
+    def dataset(self) -> Sequence:
+        """
+        Maps the CSV file and its row index if not already
+        mapped, or loads the dataset in loaded mode.
+
+        Returns:
+            Sequence: The rows of the dataset excluding the
+            header.
+        """
+        if not self.mapped:
+            return super().dataset()
+        if self.__mapped is None:
+            try:
+                self.__mapped = MappedDataset(self.DATA_FILE)
+            except FileNotFoundError:
+                print("Error: Data file not found.")
+                self.__mapped = []
+        return self.__mapped
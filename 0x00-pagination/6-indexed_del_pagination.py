@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""Indexed deletion-resilient hypermedia pagination.
+
+This module provides a LiveIndex class, a Fenwick tree
+over the liveness of integer positions, and an
+IndexedDataset dictionary that keeps one up to date as
+rows are deleted or inserted. get_hyper_index uses it to
+find the first live row at or after an index, and the
+rows after it, in logarithmic time instead of walking
+the dataset from its start.
+"""
+from array import array
+from typing import Dict, Iterable, List
+
+DelServer = __import__('3-hypermedia_del_pagination').Server
+
+
+class LiveIndex:
+    """
+    Set of non-negative integer keys that can count the
+    keys below a key and select the k-th smallest key in
+    O(log n).
+
+    Attributes:
+        bits (bytearray): Whether each key is present.
+        tree (array): The Fenwick tree of the bits.
+        size (int): The number of present keys.
+    """
+    def __init__(self, keys: Iterable[int] = (), capacity: int = 0):
+        """
+        Initializes the index with some keys.
+        """
+        self.bits = bytearray(max(1, capacity))
+        for key in keys:
+            if key >= len(self.bits):
+                self.bits.extend(bytes(key + 1 - len(self.bits)))
+            self.bits[key] = 1
+        self.__build()
+
+    def __build(self) -> None:
+        """
+        Rebuilds the tree from the bits in linear time.
+        """
+        tree = array("i", bytes(4 * (len(self.bits) + 1)))
+        for i, bit in enumerate(self.bits, 1):
+            tree[i] += bit
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self.tree = tree
+        self.size = sum(self.bits)
+
+    def __update(self, key: int, step: int) -> None:
+        """
+        Adds step to the count of a key.
+        """
+        tree = self.tree
+        i = key + 1
+        while i < len(tree):
+            tree[i] += step
+            i += i & -i
+        self.size += step
+
+    def __len__(self) -> int:
+        """
+        Returns the number of keys.
+        """
+        return self.size
+
+    def __contains__(self, key: int) -> bool:
+        """
+        Whether a key is present.
+        """
+        return 0 <= key < len(self.bits) and self.bits[key] == 1
+
+    def add(self, key: int) -> None:
+        """
+        Adds a key, doubling the capacity if needed.
+        """
+        assert type(key) == int and key >= 0, \
+            "Keys must be non-negative integers."
+        if key >= len(self.bits):
+            self.bits.extend(bytes(max(key + 1, 2 * len(self.bits)) -
+                                   len(self.bits)))
+            self.__build()
+        if not self.bits[key]:
+            self.bits[key] = 1
+            self.__update(key, 1)
+
+    def discard(self, key: int) -> None:
+        """
+        Removes a key if present.
+        """
+        if key in self:
+            self.bits[key] = 0
+            self.__update(key, -1)
+
+    def rank(self, key: int) -> int:
+        """
+        Returns the number of keys lower than key.
+        """
+        tree = self.tree
+        i = min(max(key, 0), len(self.bits))
+        count = 0
+        while i > 0:
+            count += tree[i]
+            i -= i & -i
+        return count
+
+    def select(self, k: int) -> int:
+        """
+        Returns the k-th smallest key, counting from 0.
+        """
+        if not 0 <= k < self.size:
+            raise IndexError("live index out of range")
+        tree = self.tree
+        position = 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            nxt = position + step
+            if nxt < len(tree) and tree[nxt] <= k:
+                position = nxt
+                k -= tree[nxt]
+            step >>= 1
+        return position
+
+
+class IndexedDataset(dict):
+    """
+    Dictionary of rows by position that keeps a LiveIndex
+    of its keys as rows are deleted or added.
+
+    Attributes:
+        live (LiveIndex): The index of the stored positions.
+    """
+    def __init__(self, rows: List[List]):
+        """
+        Indexes rows by position, starting at 0.
+        """
+        super().__init__(enumerate(rows))
+        self.live = LiveIndex(range(len(rows)), len(rows))
+
+    def __setitem__(self, key: int, row: List) -> None:
+        """
+        Stores a row at a position.
+        """
+        self.live.add(key)
+        super().__setitem__(key, row)
+
+    def __delitem__(self, key: int) -> None:
+        """
+        Deletes the row at a position.
+        """
+        super().__delitem__(key)
+        self.live.discard(key)
+
+    def pop(self, key: int, *default) -> List:
+        """
+        Removes and returns the row at a position.
+        """
+        if key in self:
+            self.live.discard(key)
+        return super().pop(key, *default)
+
+    def popitem(self) -> tuple:
+        """
+        Removes and returns the last stored row.
+        """
+        key, row = super().popitem()
+        self.live.discard(key)
+        return key, row
+
+    def setdefault(self, key: int, row: List = None) -> List:
+        """
+        Returns the row at a position, storing row if none.
+        """
+        if key not in self:
+            self[key] = row
+        return self[key]
+
+    def update(self, *args, **kwargs) -> None:
+        """
+        Stores several rows.
+        """
+        for key, row in dict(*args, **kwargs).items():
+            self[key] = row
+
+    def clear(self) -> None:
+        """
+        Deletes every row.
+        """
+        super().clear()
+        self.live = LiveIndex()
+
+
+class Server(DelServer):
+    """
+    Server class to paginate a database of popular baby
+    names, resilient to deletions, with an index of the
+    remaining positions.
+    """
+    def indexed_dataset(self) -> IndexedDataset:
+        """
+        Indexes the dataset by sorting position, starting
+        at 0.
+
+        Returns:
+            IndexedDataset: The indexed dataset.
+        """
+        if self.__indexed_dataset is None:
+            self.__indexed_dataset = IndexedDataset(self.dataset())
+        return self.__indexed_dataset
+
+    def get_hyper_index(self, index: int = None, page_size: int = 10) -> Dict:
+        """
+        Retrieves information about a page from a given
+        index and with a specified size, in
+        O(page_size * log n).
+
+        Args:
+            index (int): The starting index of the data.
+            page_size (int): The number of items per page.
+
+        Returns:
+            Dict: A dictionary with index, next index, page
+            size, and data.
+
+        Raises:
+            AssertionError: If index is not a valid position
+            in the dataset.
+        """
+        data = self.indexed_dataset()
+        live = data.live
+        assert index is not None and len(live) and \
+            0 <= index <= live.select(len(live) - 1)
+        first = live.rank(index)
+        last = min(first + page_size, len(live))
+        page_data = [data[live.select(k)] for k in range(first, last)]
+        return {
+            'index': index,
+            'next_index': live.select(last) if last < len(live) else None,
+            'page_size': len(page_data),
+            'data': page_data,
+        }
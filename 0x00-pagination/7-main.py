@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+Server = __import__('7-query_pagination').Server
+
+server = Server()
+
+print(server.get_hyper(1, 3, year=2012, gender="MALE", sort_by="-count"))
+print("---")
+print(server.get_hyper(2, 2, name_prefix="oli", ethnicity="HISPANIC"))
+print("---")
+print(server.get_page(1, 2, sort_by="name"))
+print("---")
+print(server.get_hyper(1, 5, name_prefix="zzz"))
+print("---")
+try:
+    server.get_page(1, 2, sort_by="gender")
+except AssertionError:
+    print("AssertionError raised when sorting by an unknown column")
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""Filtered and sorted pagination.
+
+This module provides a SecondaryIndex class, built once
+over a ColumnarDataset, holding the rows of each year,
+gender, ethnicity and first name (posting lists) and
+the rows sorted by each column (permutations), and a
+Server whose get_page and get_hyper accept filters and
+a sort order. A query is resolved to the list of its
+row positions once, from the shortest posting list it
+involves, and kept in a small LRU table, so its pages
+are then slices of that list.
+"""
+import math
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Dict, List, Sequence
+
+index_range = __import__('0-simple_helper_function').index_range
+ColumnarServer = __import__('4-columnar_pagination').Server
+
+YEAR, GENDER, ETHNICITY, NAME, COUNT, RANK = range(6)
+SORT_COLUMNS = {"year": YEAR, "name": NAME, "count": COUNT, "rank": RANK}
+QUERY_CACHE_SIZE = 256
+
+
+class SecondaryIndex:
+    """
+    Posting lists and sorted permutations of the rows of a
+    ColumnarDataset.
+
+    Attributes:
+        dataset (ColumnarDataset): The indexed dataset.
+        postings (Dict[int, Dict]): For the year, gender,
+            ethnicity and name columns, the ascending row
+            positions of each value (a code for the coded
+            columns).
+        names (List[Tuple[str, int]]): The case-folded
+            distinct names, sorted, with their codes.
+        permutations (Dict[int, array]): The row positions
+            sorted by a column, built on first use.
+    """
+    def __init__(self, dataset):
+        """
+        Builds the posting lists of a dataset.
+        """
+        self.dataset = dataset
+        columns = dataset.columns
+        self.postings = {
+            YEAR: self.__group(columns[YEAR].values),
+            GENDER: self.__group(columns[GENDER].codes),
+            ETHNICITY: self.__group(columns[ETHNICITY].codes),
+            NAME: self.__group(columns[NAME].codes),
+        }
+        self.names = sorted((name.casefold(), code) for code, name
+                            in enumerate(columns[NAME].values))
+        self.permutations = {}
+
+    @staticmethod
+    def __group(values: Sequence) -> Dict:
+        """
+        Returns the ascending positions of each value.
+        """
+        groups = {}
+        for row, value in enumerate(values):
+            rows = groups.get(value)
+            if rows is None:
+                rows = groups[value] = array("I")
+            rows.append(row)
+        return groups
+
+    def rows_of(self, column: int, value: str) -> array:
+        """
+        Returns the posting list of a value of a column.
+        """
+        if column == YEAR:
+            key = int(value)
+        else:
+            key = self.dataset.columns[column].lookup.get(value)
+        return self.postings[column].get(key, array("I"))
+
+    def rows_by_prefix(self, prefix: str) -> array:
+        """
+        Returns the ascending positions of the rows whose
+        name starts with prefix, ignoring case.
+        """
+        prefix = prefix.casefold()
+        first = bisect_left(self.names, (prefix,))
+        codes = []
+        for name, code in self.names[first:]:
+            if not name.startswith(prefix):
+                break
+            codes.append(code)
+        if len(codes) == 1:
+            return self.postings[NAME][codes[0]]
+        return array("I", sorted(row for code in codes
+                                 for row in self.postings[NAME][code]))
+
+    def permutation(self, column: int) -> array:
+        """
+        Returns the positions of all rows sorted by a column,
+        ties kept in dataset order.
+        """
+        if column not in self.permutations:
+            self.permutations[column] = array("I", sorted(
+                range(len(self.dataset)), key=self.sort_key(column)))
+        return self.permutations[column]
+
+    def sort_key(self, column: int):
+        """
+        Returns a function mapping a row position to its
+        sort key for a column.
+        """
+        if column == NAME:
+            ranks = [0] * len(self.names)
+            for rank, (_, code) in enumerate(self.names):
+                ranks[code] = rank
+            codes = self.dataset.columns[NAME].codes
+            return lambda row: ranks[codes[row]]
+        return self.dataset.columns[column].values.__getitem__
+
+
+class Server(ColumnarServer):
+    """
+    Server class to paginate a database of popular baby
+    names, filtered and sorted through secondary indexes.
+    """
+    def __init__(self):
+        """
+        Initializes a new Server instance, setting the
+        indexes to None initially.
+        """
+        super().__init__()
+        self.__index = None
+        self.__queries = OrderedDict()
+
+    def index(self) -> SecondaryIndex:
+        """
+        Builds and caches the secondary indexes of the
+        dataset if not already built.
+
+        Returns:
+            SecondaryIndex: The indexes of the dataset.
+        """
+        if self.__index is None:
+            self.__index = SecondaryIndex(self.dataset())
+        return self.__index
+
+    def query(self, year: int = None, gender: str = None,
+              ethnicity: str = None, name_prefix: str = None,
+              sort_by: str = None) -> Sequence[int]:
+        """
+        Returns the positions of the rows matching every
+        given filter, in dataset order or sorted.
+
+        Args:
+            year (int): Year of birth.
+            gender (str): Gender, such as "FEMALE".
+            ethnicity (str): Ethnicity, as written in the CSV.
+            name_prefix (str): Start of the first name,
+                ignoring case.
+            sort_by (str): "year", "name", "count" or "rank",
+                prefixed with "-" for a descending order.
+
+        Returns:
+            Sequence[int]: The row positions.
+        """
+        key = (year, gender, ethnicity, name_prefix, sort_by)
+        rows = self.__queries.get(key)
+        if rows is not None:
+            self.__queries.move_to_end(key)
+            return rows
+        rows = self.__resolve(*key)
+        self.__queries[key] = rows
+        if len(self.__queries) > QUERY_CACHE_SIZE:
+            self.__queries.popitem(last=False)
+        return rows
+
+    def __resolve(self, year: int, gender: str, ethnicity: str,
+                  name_prefix: str, sort_by: str) -> Sequence[int]:
+        """
+        Computes the positions of the rows of a query.
+        """
+        index = self.index()
+        columns = self.dataset().columns
+        descending = sort_by is not None and sort_by.startswith("-")
+        if sort_by is not None:
+            assert sort_by.lstrip("-") in SORT_COLUMNS, \
+                "Sort column must be one of {}.".format(
+                    ", ".join(SORT_COLUMNS))
+            sort_column = SORT_COLUMNS[sort_by.lstrip("-")]
+        filters = [(column, value) for column, value in
+                   ((YEAR, year), (GENDER, gender), (ETHNICITY, ethnicity))
+                   if value is not None]
+        if not filters and name_prefix is None:
+            if sort_by is None:
+                return range(len(self.dataset()))
+            rows = index.permutation(sort_column)
+            if descending:
+                rows = array("I", reversed(rows))
+            return rows
+        candidates = [index.rows_of(column, value)
+                      for column, value in filters]
+        if name_prefix is not None:
+            candidates.append(index.rows_by_prefix(name_prefix))
+        rows = min(candidates, key=len)
+        for column, value in filters:
+            if len(rows) == 0:
+                break
+            if column == YEAR:
+                values, wanted = columns[YEAR].values, int(value)
+            else:
+                values = columns[column].codes
+                wanted = columns[column].lookup.get(value)
+            if rows is not index.rows_of(column, value):
+                rows = array("I", (row for row in rows
+                                   if values[row] == wanted))
+        if name_prefix is not None and len(candidates) > 1:
+            prefix = name_prefix.casefold()
+            names, codes = columns[NAME].values, columns[NAME].codes
+            rows = array("I", (row for row in rows
+                               if names[codes[row]].casefold()
+                               .startswith(prefix)))
+        if sort_by is not None:
+            rows = array("I", sorted(rows, key=index.sort_key(sort_column)))
+            if descending:
+                rows.reverse()
+        return rows
+
+    def get_page(self, page: int = 1, page_size: int = 10,
+                 **query) -> List[List]:
+        """
+        Retrieves a page of the rows matching a query.
+
+        Args:
+            page (int): The page number (1-indexed).
+            page_size (int): The number of items per page.
+            **query: Filters and sort order, as for query.
+
+        Returns:
+            List[List]: A list of rows for the specified page.
+
+        Raises:
+            AssertionError: If page or page_size is not a
+            positive integer.
+        """
+        if not query:
+            return super().get_page(page, page_size)
+        assert type(page) == int and type(page_size) == int, \
+            "Page and page size must be integers."
+        assert page > 0 and page_size > 0, \
+            "Page and page size must be positive."
+
+        start, end = index_range(page, page_size)
+        rows = self.query(**query)
+        data = self.dataset()
+        return [data.row(row) for row in rows[start:end]]
+
+    def get_hyper(self, page: int = 1, page_size: int = 10,
+                  **query) -> Dict:
+        """
+        Retrieves information about a page of the rows
+        matching a query, including data and pagination
+        details.
+
+        Args:
+            page (int): The page number (1-indexed).
+            page_size (int): The number of items per page.
+            **query: Filters and sort order, as for query.
+
+        Returns:
+            Dict: A dictionary with page size, page number,
+            data, next page, previous page, and total pages
+            of the filtered rows.
+        """
+        if not query:
+            return super().get_hyper(page, page_size)
+        page_data = self.get_page(page, page_size, **query)
+        start, end = index_range(page, page_size)
+        total = len(self.query(**query))
+        return {
+            'page_size': len(page_data),
+            'page': page,
+            'data': page_data,
+            'next_page': page + 1 if end < total else None,
+            'prev_page': page - 1 if start > 0 else None,
+            'total_pages': math.ceil(total / page_size),
+        }
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+import itertools
+
+Server = __import__('8-streaming_pagination').Server
+
+server = Server()
+
+pages = server.iter_pages(2)
+for page in itertools.islice(pages, 2):
+    print(list(page), page.cursor)
+print("---")
+cursor = page.cursor
+print(list(next(server.iter_pages(2, cursor))))
+print(next(server.iter_rows(cursor)))
+print("---")
+print(sum(1 for _ in server.iter_rows()))
+print(sum(len(page) for page in server.iter_pages(1000)))
+print(list(server.iter_rows(19416)))
+try:
+    next(server.iter_pages(2, "not-a-cursor"))
+except AssertionError:
+    print("AssertionError raised with an invalid cursor")
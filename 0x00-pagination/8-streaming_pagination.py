@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Streaming pagination.
+
+This module provides a Server whose iter_rows and
+iter_pages generators stream the dataset, mapped or
+loaded, for exports that would otherwise call get_page
+in a loop. Rows are built in fixed-size batches whatever
+the page size, pages are lazy views over the dataset,
+and every position can be resumed from through an
+opaque cursor.
+"""
+import base64
+import binascii
+import struct
+from collections.abc import Sequence
+from typing import Iterator, List, Union
+
+MappedServer = __import__('5-mmap_pagination').Server
+
+CURSOR = struct.Struct("<BQ")
+CURSOR_VERSION = 1
+BATCH_SIZE = 1024
+
+
+def encode_cursor(position: int) -> str:
+    """
+    Returns the opaque cursor of a row position.
+    """
+    raw = CURSOR.pack(CURSOR_VERSION, position)
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """
+    Returns the row position of a cursor.
+
+    Raises:
+        AssertionError: If cursor was not made by
+        encode_cursor.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        version, position = CURSOR.unpack(raw)
+    except (binascii.Error, struct.error, TypeError, ValueError):
+        version = None
+    assert version == CURSOR_VERSION, "Invalid cursor."
+    return position
+
+
+def stream(dataset: Sequence, start: int, stop: int) -> Iterator[List]:
+    """
+    Yields the rows start to stop of a dataset, building
+    at most BATCH_SIZE of them at a time.
+    """
+    for first in range(start, stop, BATCH_SIZE):
+        yield from dataset[first:min(first + BATCH_SIZE, stop)]
+
+
+class Page(Sequence):
+    """
+    Lazy view of the rows of one page.
+
+    Attributes:
+        start (int): The position of the first row.
+        stop (int): The position after the last row.
+        cursor (str): The cursor of the next page, or None
+            after the last page.
+    """
+    def __init__(self, dataset: Sequence, start: int, stop: int):
+        """
+        Initializes the view of rows start to stop.
+        """
+        self.dataset = dataset
+        self.start = start
+        self.stop = stop
+        self.cursor = encode_cursor(stop) if stop < len(dataset) else None
+
+    def __len__(self) -> int:
+        """
+        Returns the number of rows of the page.
+        """
+        return self.stop - self.start
+
+    def __getitem__(self, index: Union[int, slice]) -> List:
+        """
+        Builds a row, or the rows of a slice, of the page.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            return self.dataset[self.start + start:self.start + stop:step]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("page index out of range")
+        return self.dataset[self.start + index]
+
+    def __iter__(self) -> Iterator[List]:
+        """
+        Streams the rows of the page.
+        """
+        return stream(self.dataset, self.start, self.stop)
+
+
+class Server(MappedServer):
+    """
+    Server class to stream a database of popular baby
+    names row by row or page by page.
+    """
+    def __position(self, start: Union[int, str, None]) -> int:
+        """
+        Returns the row position of an index or a cursor.
+        """
+        if start is None:
+            return 0
+        if isinstance(start, str):
+            start = decode_cursor(start)
+        assert type(start) == int and start >= 0, \
+            "Start must be a non-negative integer or a cursor."
+        return start
+
+    def iter_rows(self, start: Union[int, str, None] = 0) -> Iterator[List]:
+        """
+        Streams the rows of the dataset from a position.
+
+        Args:
+            start (Union[int, str]): The position of the
+                first row, or a cursor.
+
+        Returns:
+            Iterator[List]: The rows, built in batches.
+        """
+        data = self.dataset()
+        return stream(data, min(self.__position(start), len(data)),
+                      len(data))
+
+    def iter_pages(self, page_size: int = 10,
+                   cursor: Union[str, None] = None) -> Iterator[Page]:
+        """
+        Streams the pages of the dataset from the beginning or
+        from a cursor.
+
+        Args:
+            page_size (int): The number of items per page.
+            cursor (str): The cursor of a page returned by an
+                earlier iteration.
+
+        Returns:
+            Iterator[Page]: Lazy pages, each with the cursor
+            of the next one.
+
+        Raises:
+            AssertionError: If page_size is not a positive
+            integer or cursor is invalid.
+        """
+        assert type(page_size) == int and page_size > 0, \
+            "Page size must be a positive integer."
+        data = self.dataset()
+        return (Page(data, first, min(first + page_size, len(data)))
+                for first in range(self.__position(cursor), len(data),
+                                   page_size))
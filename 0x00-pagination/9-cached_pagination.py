@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Cached hypermedia pagination.
+
+This module provides a Server that keeps the responses
+of get_hyper, and their JSON encoding, in a bounded LRU
+cache from the caching project, keyed by page and page
+size. The dataset never changes once loaded, so a cached
+response stays valid until the CSV file itself changes:
+its size and modification time are checked at most once
+per CHECK_INTERVAL seconds, and any change drops the
+dataset and every cached response at once.
+"""
+import json
+import os
+import sys
+import time
+from typing import Dict, Optional, Tuple
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             os.pardir, "0x01-caching"))
+
+LRUCache = __import__('3-lru_cache').LRUCache
+ColumnarServer = __import__('4-columnar_pagination').Server
+ColumnarDataset = __import__('4-columnar_pagination').ColumnarDataset
+
+RESPONSE_CACHE_SIZE = 1024
+CHECK_INTERVAL = 1.0
+
+
+def ignore_discard(key, item) -> None:
+    """
+    Eviction callback that drops cached responses silently.
+    """
+
+
+class Server(ColumnarServer):
+    """
+    Server class to paginate a database of popular baby
+    names, caching the hypermedia responses.
+
+    Attributes:
+        responses (LRUCache): The cached responses, and
+            their JSON encodings, by page and page size.
+    """
+    def __init__(self, max_responses: int = RESPONSE_CACHE_SIZE):
+        """
+        Initializes a new Server instance with an empty
+        response cache.
+
+        Args:
+            max_responses (int): The number of responses
+                kept, counting a JSON encoding as one.
+        """
+        super().__init__()
+        self.responses = LRUCache(max_items=max_responses,
+                                  on_evict=ignore_discard)
+        self.__loaded = None
+        self.__signature = None
+        self.__checked = 0.0
+
+    def __stat(self) -> Optional[Tuple[int, int]]:
+        """
+        Returns the size and modification time of the CSV
+        file, or None if it is missing.
+        """
+        try:
+            stat = os.stat(self.DATA_FILE)
+        except FileNotFoundError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def check(self) -> bool:
+        """
+        Drops the dataset and all cached responses if the
+        CSV file changed since it was loaded.
+
+        Returns:
+            bool: Whether the file changed.
+        """
+        self.__checked = time.monotonic()
+        if self.__loaded is None or self.__stat() == self.__signature:
+            return False
+        self.__loaded = None
+        self.responses = LRUCache(max_items=self.responses.max_items,
+                                  on_evict=ignore_discard)
+        return True
+
+    def dataset(self) -> ColumnarDataset:
+        """
+        Loads and caches the dataset from the CSV file if
+        not already loaded, recording the file signature.
+
+        Returns:
+            ColumnarDataset: The loaded dataset excluding the
+            header.
+        """
+        if time.monotonic() - self.__checked >= CHECK_INTERVAL:
+            self.check()
+        if self.__loaded is None:
+            self.__signature = self.__stat()
+            try:
+                self.__loaded = ColumnarDataset.from_csv(self.DATA_FILE)
+            except FileNotFoundError:
+                print("Error: Data file not found.")
+                self.__loaded = ColumnarDataset([])
+        return self.__loaded
+
+    def get_hyper(self, page: int = 1, page_size: int = 10) -> Dict:
+        """
+        Retrieves information about a page, including data
+        and pagination details, from the cache when it was
+        built before. Cached responses are shared between
+        callers and must not be modified.
+
+        Args:
+            page (int): The page number (1-indexed).
+            page_size (int): The number of items per page.
+
+        Returns:
+            Dict: A dictionary with page size, page number,
+            data, next page, previous page, and total pages.
+        """
+        assert type(page) == int and type(page_size) == int, \
+            "Page and page size must be integers."
+        self.dataset()
+        response = self.responses.get((page, page_size))
+        if response is None:
+            response = super().get_hyper(page, page_size)
+            self.responses.put((page, page_size), response)
+        return response
+
+    def get_hyper_json(self, page: int = 1, page_size: int = 10) -> bytes:
+        """
+        Retrieves the JSON encoding of get_hyper, from the
+        cache when it was encoded before.
+
+        Args:
+            page (int): The page number (1-indexed).
+            page_size (int): The number of items per page.
+
+        Returns:
+            bytes: The UTF-8 encoded JSON response.
+        """
+        assert type(page) == int and type(page_size) == int, \
+            "Page and page size must be integers."
+        self.dataset()
+        body = self.responses.get(("json", page, page_size))
+        if body is None:
+            body = json.dumps(self.get_hyper(page, page_size),
+                              separators=(",", ":")).encode()
+            self.responses.put(("json", page, page_size), body)
+        return body
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+import os
+import shutil
+import tempfile
+import time
+
+Server = __import__('9-cached_pagination').Server
+
+server = Server()
+
+print(server.get_hyper(1, 2))
+print(server.get_hyper(1, 2) is server.get_hyper(1, 2))
+print(server.get_hyper_json(3000, 100))
+print(server.responses.snapshot()["hits"])
+
+start = time.perf_counter()
+for page in range(1, 101):
+    server.get_hyper(page, 100)
+uncached = time.perf_counter() - start
+start = time.perf_counter()
+for page in range(1, 101):
+    server.get_hyper(page, 100)
+cached = time.perf_counter() - start
+print("uncached {:.1f} us, cached {:.1f} us".format(
+    uncached * 1e4, cached * 1e4))
+
+copy = os.path.join(tempfile.mkdtemp(), Server.DATA_FILE)
+shutil.copy(Server.DATA_FILE, copy)
+server.DATA_FILE = copy
+print(server.get_hyper(1, 1)["total_pages"])
+with open(copy, "a") as f:
+    f.write("2017,FEMALE,HISPANIC,Ada,10,1\n")
+server.check()
+print(server.get_hyper(1, 1)["total_pages"])
+os.remove(copy)
@@ -15,14 +15,22 @@ class BasicCache(BaseCaching):
     Represents an object that allows storing and
     retrieving items from a dictionary.
     """
-    def put(self, key, item):
+    def _is_full(self, size=0, count=1):
         """
-        Adds an item in the cache.
+        A basic cache never runs out of room.
+        """
+        return False
+
+    def put(self, key, item, ttl=None):
+        """
+        Adds an item in the cache, expiring after ttl seconds
+        (or the default ttl) when one is given.
         """
         try:
             if key is None or item is None:
                 return
             self.cache_data[key] = item
+            self._set_expiry(key, ttl)
         except Exception as e:
             print(f"Error in put method: {e}")
 
@@ -31,6 +39,8 @@ class BasicCache(BaseCaching):
         Retrieves an item by key.
         """
         try:
-            return self.cache_data.get(key, None)
+            if key is None or not self._live(key):
+                return None
+            return self.cache_data[key]
         except Exception as e:
             print(f"Error in get method: {e}")
@@ -18,35 +18,41 @@ class FIFOCache(BaseCaching):
     retrieving items from a dictionary with a FIFO
     removal mechanism when the limit is reached.
     """
-    def __init__(self):
+    def __init__(self, *args, **kwargs):
         """
-        Initializes the cache.
+        Initializes the cache, accepting the same capacity
+        arguments as BaseCaching.
         """
         try:
-            super().__init__()
+            super().__init__(*args, **kwargs)
             self.cache_data = OrderedDict()
         except Exception as e:
             print(f"Error in initialization: {e}")
 
-    def put(self, key, item):
+    def put(self, key, item, ttl=None):
         """
-        Adds an item in the cache.
+        Adds an item in the cache, expiring after ttl seconds
+        (or the default ttl) when one is given.
         """
         try:
             if key is None or item is None:
                 return
-            self.cache_data[key] = item
-            if len(self.cache_data) > BaseCaching.MAX_ITEMS:
-                first_key, _ = self.cache_data.popitem(last=False)
-                print("DISCARD:", first_key)
+            self._store(key, item, ttl)
         except Exception as e:
             print(f"Error in put method: {e}")
 
+    def _evict(self):
+        """
+        Removes the first-in item and returns its key
+        and item.
+        """
+        return self.cache_data.popitem(last=False)
+
     def get(self, key):
         """
         Retrieves an item by key.
         """
         try:
-            return self.cache_data.get(key, None)
+            return self._fetch(key)
         except Exception as e:
             print(f"Error in get method: {e}")
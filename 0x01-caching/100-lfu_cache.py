@@ -6,6 +6,13 @@ Least Frequently Used caching module.
 This module provides a LFUCache class for
 implementing a caching system
 with a Least Frequently Used (LFU) eviction policy.
+
+Keys are grouped in frequency buckets (a mapping of
+use count to an ordered set of keys) and the lowest
+non-empty count is tracked, so get, put and eviction
+all run in constant time; after the lowest bucket
+empties, the count is only looked up again if another
+eviction comes before the next insert.
 """
 
 from collections import OrderedDict
@@ -17,70 +24,122 @@ class LFUCache(BaseCaching):
     Represents an object that allows storing and
     retrieving items from a dictionary with a LFU
     removal mechanism when the limit is reached.
+    Among keys with the same frequency, the least
+    recently used one is removed first.
     """
-    def __init__(self):
+    def __init__(self, *args, **kwargs):
         """
-        Initializes the cache.
+        Initializes the cache, accepting the same capacity
+        arguments as BaseCaching.
         """
         try:
-            super().__init__()
+            super().__init__(*args, **kwargs)
             self.cache_data = OrderedDict()
-            self.keys_freq = []
+            self.keys_freq = {}
+            self.freq_keys = {}
+            self.min_freq = 0
         except Exception as e:
             print(f"Error in initialization: {e}")
 
-    def __reorder_items(self, mru_key):
+    def __increment(self, key):
         """
-        Reorders the items in this cache based on the most
-        recently used item.
+        Moves a key into the bucket of the next frequency,
+        behind the keys that reached that frequency before it.
         """
         try:
-            max_positions = []
-            mru_freq = 0
-            mru_pos = 0
-            ins_pos = 0
-            for i, key_freq in enumerate(self.keys_freq):
-                if key_freq[0] == mru_key:
-                    mru_freq = key_freq[1] + 1
-                    mru_pos = i
-                    break
-                elif len(max_positions) == 0:
-                    max_positions.append(i)
-                elif key_freq[1] < self.keys_freq[max_positions[-1]][1]:
-                    max_positions.append(i)
-            max_positions.reverse()
-            for pos in max_positions:
-                if self.keys_freq[pos][1] > mru_freq:
-                    break
-                ins_pos = pos
-            self.keys_freq.pop(mru_pos)
-            self.keys_freq.insert(ins_pos, [mru_key, mru_freq])
+            freq = self.keys_freq[key]
+            bucket = self.freq_keys[freq]
+            del bucket[key]
+            if not bucket:
+                del self.freq_keys[freq]
+                if self.min_freq == freq:
+                    self.min_freq = freq + 1
+            self.keys_freq[key] = freq + 1
+            self.freq_keys.setdefault(freq + 1, OrderedDict())[key] = None
         except Exception as e:
-            print(f"Error in __reorder_items method: {e}")
+            print(f"Error in __increment method: {e}")
+
+    def _evict(self):
+        """
+        Removes the least recently used key of the lowest
+        frequency and returns it with its item.
+
+        min_freq is left behind when its bucket empties, as
+        the next put usually resets it to zero; only an
+        eviction that comes first looks up the new lowest
+        frequency.
+        """
+        if self.min_freq not in self.freq_keys:
+            self.min_freq = min(self.freq_keys)
+        bucket = self.freq_keys[self.min_freq]
+        lfu_key, _ = bucket.popitem(last=False)
+        if not bucket:
+            del self.freq_keys[self.min_freq]
+        del self.keys_freq[lfu_key]
+        return lfu_key, self.cache_data.pop(lfu_key)
+
+    def _forget(self, key):
+        """
+        Removes an expired or deleted key from its bucket.
+        """
+        freq = self.keys_freq.pop(key)
+        bucket = self.freq_keys[freq]
+        del bucket[key]
+        if not bucket:
+            del self.freq_keys[freq]
+
+    def _insert(self, key, item):
+        """
+        Stores a new key in the bucket of frequency zero.
+        """
+        self.cache_data[key] = item
+        self.keys_freq[key] = 0
+        self.freq_keys.setdefault(0, OrderedDict())[key] = None
+        self.min_freq = 0
+
+    def _update(self, key, item):
+        """
+        Replaces an item, counting the put as a use.
+        """
+        self.cache_data[key] = item
+        self.__increment(key)
+
+    def _touch(self, key):
+        """
+        Counts a hit as a use.
+        """
+        self.__increment(key)
+
+    def _entries(self):
+        """
+        Yields the keys bucket by bucket, from the lowest
+        frequency, with their frequency.
+        """
+        for freq in sorted(self.freq_keys):
+            for key in self.freq_keys[freq]:
+                yield key, freq
+
+    def _restore(self, key, item, freq):
+        """
+        Stores a key read from a snapshot at the end of the
+        bucket of its saved frequency. A stale min_freq is
+        never above the lowest stored frequency, so taking
+        the lower of the two keeps it that way.
+        """
+        self.min_freq = min(self.min_freq, freq)
+        self.cache_data[key] = item
+        self.keys_freq[key] = freq
+        self.freq_keys.setdefault(freq, OrderedDict())[key] = None
 
-    def put(self, key, item):
+    def put(self, key, item, ttl=None):
         """
-        Adds an item in the cache.
+        Adds an item in the cache, expiring after ttl seconds
+        (or the default ttl) when one is given.
         """
         try:
             if key is None or item is None:
                 return
-            if key not in self.cache_data:
-                if len(self.cache_data) + 1 > BaseCaching.MAX_ITEMS:
-                    lfu_key, _ = self.keys_freq[-1]
-                    self.cache_data.pop(lfu_key)
-                    self.keys_freq.pop()
-                    print("DISCARD:", lfu_key)
-                self.cache_data[key] = item
-                ins_index = len(self.keys_freq)
-                for i, key_freq in enumerate(self.keys_freq):
-                    if key_freq[1] == 0:
-                        ins_index = i
-                        break
-                self.keys_freq.insert(ins_index, [key, 0])
-            else:
-                self.cache_data[key] = item
-                self.__reorder_items(key)
+            self._store(key, item, ttl)
         except Exception as e:
             print(f"Error in put method: {e}")
 
@@ -89,8 +148,6 @@ class LFUCache(BaseCaching):
         Retrieves an item by key.
         """
         try:
-            if key is not None and key in self.cache_data:
-                self.__reorder_items(key)
-            return self.cache_data.get(key, None)
+            return self._fetch(key)
         except Exception as e:
             print(f"Error in get method: {e}")
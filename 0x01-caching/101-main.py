@@ -0,0 +1,42 @@
+#!/usr/bin/python3
+""" 101-main """
+import random
+import threading
+import time
+
+ShardedCache = __import__('101-sharded_cache').ShardedCache
+LockedCache = __import__('101-sharded_cache').LockedCache
+LRUCache = __import__('3-lru_cache').LRUCache
+
+my_cache = ShardedCache(LRUCache, shards=4, max_items=8)
+for key in range(10):
+    my_cache.put(key, "item {}".format(key))
+my_cache.print_cache()
+print(my_cache.get(9))
+print(my_cache.get(1))
+
+
+def worker(cache, ops, seed):
+    """ Mixed get/put load on 1000 keys """
+    rand = random.Random(seed)
+    for _ in range(ops):
+        key = rand.randrange(1000)
+        if cache.get(key) is None:
+            cache.put(key, key)
+
+
+print("threads  locked ops/s  sharded ops/s")
+for threads in (1, 2, 4, 8):
+    rates = []
+    for cache in (LockedCache(LRUCache, max_items=16000),
+                  ShardedCache(LRUCache, shards=16, max_items=16000)):
+        ops = 200000 // threads
+        pool = [threading.Thread(target=worker, args=(cache, ops, i))
+                for i in range(threads)]
+        start = time.perf_counter()
+        for t in pool:
+            t.start()
+        for t in pool:
+            t.join()
+        rates.append(ops * threads / (time.perf_counter() - start))
+    print("{:7d}  {:12.0f}  {:13.0f}".format(threads, *rates))
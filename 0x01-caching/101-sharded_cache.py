@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+
+"""
+Thread-safe caching module.
+
+This module provides a LockedCache class that guards
+any caching policy with a single lock, and a
+ShardedCache class that hashes keys across several
+independently locked segments so that threads working
+on different keys do not wait for each other.
+"""
+
+import threading
+
+LRUCache = __import__('3-lru_cache').LRUCache
+
+
+class LockedCache():
+    """
+    Represents a caching policy whose get and put calls
+    are serialized by a single lock.
+    """
+    def __init__(self, policy=LRUCache, *args, **kwargs):
+        """
+        Initializes the cache.
+
+        Args:
+            policy (type): The BaseCaching subclass to use.
+            *args, **kwargs: Arguments for the policy.
+        """
+        self.lock = threading.Lock()
+        self.cache = policy(*args, **kwargs)
+
+    @property
+    def cache_data(self):
+        """
+        The items stored in the guarded cache.
+        """
+        return self.cache.cache_data
+
+    def print_cache(self):
+        """
+        Prints the cache.
+        """
+        with self.lock:
+            self.cache.print_cache()
+
+    def put(self, key, item, ttl=None):
+        """
+        Adds an item in the cache.
+        """
+        with self.lock:
+            self.cache.put(key, item, ttl)
+
+    def get(self, key):
+        """
+        Retrieves an item by key.
+        """
+        with self.lock:
+            return self.cache.get(key)
+
+    def put_many(self, mapping, ttl=None):
+        """
+        Adds several items in the cache.
+        """
+        with self.lock:
+            self.cache.put_many(mapping, ttl)
+
+    def get_many(self, keys):
+        """
+        Retrieves the items of several keys.
+        """
+        with self.lock:
+            return self.cache.get_many(keys)
+
+    def snapshot(self):
+        """
+        Returns the statistics of the guarded cache.
+        """
+        with self.lock:
+            return self.cache.snapshot()
+
+    def start_sweeper(self, interval=1.0):
+        """
+        Expires items in the background under the cache lock.
+        """
+        self.cache.start_sweeper(interval, self.lock)
+
+    def stop_sweeper(self):
+        """
+        Stops the background sweeper.
+        """
+        self.cache.stop_sweeper()
+
+
+class ShardedCache():
+    """
+    Represents a cache split into segments, each running
+    its own instance of the policy behind its own lock.
+    The capacity is divided between the segments, the
+    first ones taking one more entry or byte when it does
+    not divide evenly, so the total matches the budget.
+    """
+    def __init__(self, policy=LRUCache, shards=16, max_items=None,
+                 max_bytes=None, **kwargs):
+        """
+        Initializes the cache.
+
+        Args:
+            policy (type): The BaseCaching subclass to use.
+            shards (int): Number of segments.
+            max_items (int): Total maximum number of entries.
+            max_bytes (int): Optional total byte budget.
+            **kwargs: Other arguments for the policy.
+        """
+        assert type(shards) == int and shards > 0, \
+            "Shards must be a positive integer."
+        if max_items is None:
+            max_items = policy.MAX_ITEMS
+        assert shards <= max_items and \
+            (max_bytes is None or shards <= max_bytes), \
+            "Shards must not outnumber max_items or max_bytes."
+        self.segments = [
+            LockedCache(policy, max_items=self.__share(max_items, shards, i),
+                        max_bytes=self.__share(max_bytes, shards, i),
+                        **kwargs)
+            for i in range(shards)
+        ]
+
+    @staticmethod
+    def __share(total, shards, i):
+        """
+        Returns the part of a budget given to segment i.
+        """
+        if total is None:
+            return None
+        return total // shards + (i < total % shards)
+
+    @property
+    def cache_data(self):
+        """
+        A merged copy of the items stored in all segments.
+        """
+        merged = {}
+        for segment in self.segments:
+            with segment.lock:
+                merged.update(segment.cache_data)
+        return merged
+
+    def segment(self, key):
+        """
+        Returns the segment responsible for a key.
+        """
+        return self.segments[hash(key) % len(self.segments)]
+
+    def print_cache(self):
+        """
+        Prints the cache.
+        """
+        data = self.cache_data
+        print("Current cache:")
+        for key in sorted(data.keys()):
+            print("{}: {}".format(key, data.get(key)))
+
+    def put(self, key, item, ttl=None):
+        """
+        Adds an item in the cache.
+        """
+        if key is None or item is None:
+            return
+        self.segment(key).put(key, item, ttl)
+
+    def get(self, key):
+        """
+        Retrieves an item by key.
+        """
+        if key is None:
+            return None
+        return self.segment(key).get(key)
+
+    def put_many(self, mapping, ttl=None):
+        """
+        Adds several items, taking each segment lock once.
+        """
+        if hasattr(mapping, "items"):
+            mapping = mapping.items()
+        batches = {}
+        for key, item in mapping:
+            if key is not None and item is not None:
+                batches.setdefault(self.segment(key), []).append((key, item))
+        for segment, batch in batches.items():
+            segment.put_many(batch, ttl)
+
+    def get_many(self, keys):
+        """
+        Retrieves several items, taking each segment lock once.
+        """
+        batches = {}
+        for key in keys:
+            if key is not None:
+                batches.setdefault(self.segment(key), []).append(key)
+        found = {}
+        for segment, batch in batches.items():
+            found.update(segment.get_many(batch))
+        return found
+
+    def snapshot(self):
+        """
+        Returns the statistics of all segments added together.
+        """
+        stats = {}
+        for segment in self.segments:
+            for name, value in segment.snapshot().items():
+                if isinstance(value, dict):
+                    merged = stats.setdefault(name, {})
+                    for bound, count in value.items():
+                        merged[bound] = merged.get(bound, 0) + count
+                else:
+                    stats[name] = stats.get(name, 0) + value
+        lookups = stats.get("hits", 0) + stats.get("misses", 0)
+        stats["hit_ratio"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def start_sweeper(self, interval=1.0):
+        """
+        Expires items of every segment in the background.
+        """
+        for segment in self.segments:
+            segment.start_sweeper(interval)
+
+    def stop_sweeper(self):
+        """
+        Stops the background sweepers.
+        """
+        for segment in self.segments:
+            segment.stop_sweeper()
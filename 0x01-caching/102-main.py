@@ -0,0 +1,22 @@
+#!/usr/bin/python3
+""" 102-main """
+import time
+LRUCache = __import__('3-lru_cache').LRUCache
+
+my_cache = LRUCache(default_ttl=0.5)
+my_cache.put("A", "Hello")
+my_cache.put("B", "World", ttl=0.1)
+my_cache.put("C", "Holberton", ttl=60)
+my_cache.print_cache()
+time.sleep(0.2)
+print(my_cache.get("B"))
+my_cache.print_cache()
+my_cache.start_sweeper(0.1)
+time.sleep(0.6)
+my_cache.stop_sweeper()
+my_cache.print_cache()
+my_cache.put("D", "School")
+my_cache.put("E", "Battery")
+my_cache.put("F", "Mission")
+my_cache.put("G", "San Francisco")
+my_cache.print_cache()
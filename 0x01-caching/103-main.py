@@ -0,0 +1,12 @@
+#!/usr/bin/python3
+""" 103-main """
+LRUCache = __import__('3-lru_cache').LRUCache
+
+my_cache = LRUCache()
+my_cache.put_many({"A": "Hello", "B": "World", "C": "Holberton"})
+my_cache.print_cache()
+print(my_cache.get_many(["A", "C", "Z"]))
+my_cache.put_many([("B", "Street"), ("D", "School"), ("E", "Battery")])
+my_cache.print_cache()
+my_cache.put_many({"F": "Mission", "G": "San Francisco"})
+my_cache.print_cache()
@@ -0,0 +1,28 @@
+#!/usr/bin/python3
+""" 104-main """
+import threading
+import time
+
+memoize = __import__('104-memoize').memoize
+LFUCache = __import__('100-lfu_cache').LFUCache
+
+
+@memoize(LFUCache, max_items=2)
+def slow_square(n):
+    """ Takes a while to square n """
+    time.sleep(0.1)
+    return n * n
+
+
+threads = [threading.Thread(target=slow_square, args=(3,)) for _ in range(5)]
+for t in threads:
+    t.start()
+for t in threads:
+    t.join()
+print(slow_square.cache_info())
+print(slow_square(3))
+print(slow_square(4))
+print(slow_square(5))
+print(slow_square.cache_info())
+slow_square.cache_clear()
+print(slow_square.cache_info())
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+
+"""
+Memoization module.
+
+This module provides a memoize decorator that stores
+the results of a function in any of the caching
+policies. Concurrent calls with the same arguments
+share a single computation.
+"""
+
+import functools
+import threading
+
+LRUCache = __import__('3-lru_cache').LRUCache
+
+
+class Flight():
+    """
+    Represents a computation in progress, awaited by the
+    callers that asked for the same key meanwhile.
+    """
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        """
+        Initializes the flight.
+        """
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def ignore_discard(key, item):
+    """
+    Eviction callback that drops memoized results silently.
+    """
+
+
+def make_key(args, kwargs):
+    """
+    Builds a hashable cache key from call arguments.
+
+    Args:
+        args (tuple): Positional arguments.
+        kwargs (dict): Keyword arguments.
+
+    Returns:
+        tuple: The key.
+
+    Raises:
+        TypeError: If an argument is not hashable.
+    """
+    key = args
+    if kwargs:
+        key += (make_key,) + tuple(sorted(kwargs.items()))
+    hash(key)
+    return key
+
+
+def memoize(policy=LRUCache, **options):
+    """
+    Caches the results of a function in a caching policy.
+
+    The wrapper exposes cache_info(), returning the hit,
+    miss and shared call counters, and cache_clear().
+    Calls with unhashable arguments are not cached.
+
+    Args:
+        policy (type): The BaseCaching subclass to use.
+        **options: Arguments for the policy, such as
+            max_items or default_ttl. Evicted results are
+            dropped silently unless on_evict is given.
+
+    Returns:
+        callable: The decorator.
+    """
+    options.setdefault("on_evict", ignore_discard)
+
+    def decorator(func):
+        """
+        Wraps func with a cache.
+        """
+        lock = threading.Lock()
+        flights = {}
+        stats = {"hits": 0, "misses": 0, "shared": 0, "uncached": 0}
+        state = {"cache": policy(**options)}
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            """
+            Returns the cached result or computes it once.
+            """
+            try:
+                key = make_key(args, kwargs)
+            except TypeError:
+                with lock:
+                    stats["uncached"] += 1
+                return func(*args, **kwargs)
+            with lock:
+                entry = state["cache"].get(key)
+                if entry is not None:
+                    stats["hits"] += 1
+                    return entry[0]
+                flight = flights.get(key)
+                leader = flight is None
+                if leader:
+                    flight = flights[key] = Flight()
+                    stats["misses"] += 1
+                else:
+                    stats["shared"] += 1
+            if not leader:
+                flight.done.wait()
+                if flight.error is not None:
+                    raise flight.error
+                return flight.result
+            try:
+                flight.result = func(*args, **kwargs)
+                with lock:
+                    state["cache"].put(key, (flight.result,))
+                return flight.result
+            except BaseException as e:
+                flight.error = e
+                raise
+            finally:
+                with lock:
+                    del flights[key]
+                flight.done.set()
+
+        def cache_info():
+            """
+            Returns the counters and the current cache size.
+            """
+            with lock:
+                info = dict(stats)
+                info["size"] = len(state["cache"].cache_data)
+                info["max_items"] = state["cache"].max_items
+            return info
+
+        def cache_clear():
+            """
+            Empties the cache and resets the counters.
+            """
+            with lock:
+                state["cache"] = policy(**options)
+                for name in stats:
+                    stats[name] = 0
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
@@ -0,0 +1,17 @@
+#!/usr/bin/python3
+""" 105-main """
+LRUCache = __import__('3-lru_cache').LRUCache
+
+evicted = []
+my_cache = LRUCache(on_evict=lambda key, item: evicted.append(key),
+                    timing=True)
+for key in "ABCDEFG":
+    my_cache.put(key, key.lower())
+for key in "GFEDCBA":
+    my_cache.get(key)
+my_cache.print_cache()
+print(evicted)
+stats = my_cache.snapshot()
+for name in ("hits", "misses", "insertions", "evictions", "hit_ratio"):
+    print("{}: {}".format(name, stats[name]))
+print(sum(stats["get_ns"].values()), sum(stats["put_ns"].values()))
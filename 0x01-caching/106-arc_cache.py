@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+
+"""
+Adaptive Replacement caching module.
+
+This module provides an ARCCache class for
+implementing a caching system
+with an Adaptive Replacement Cache (ARC) eviction policy.
+
+Resident keys are split between a recency list (seen
+once) and a frequency list (seen again). Keys evicted
+from each list are remembered in a ghost list, and a hit
+on a ghost shifts the target size of the recency list,
+so the cache adapts between LRU and LFU behaviour.
+Every operation runs in constant time.
+"""
+
+from collections import OrderedDict
+from base_caching import BaseCaching
+
+
+class ARCCache(BaseCaching):
+    """
+    Represents an object that allows storing and
+    retrieving items from a dictionary with an ARC
+    removal mechanism when the limit is reached.
+    """
+    def __init__(self, *args, **kwargs):
+        """
+        Initializes the cache, accepting the same capacity
+        arguments as BaseCaching.
+        """
+        try:
+            super().__init__(*args, **kwargs)
+            self.recent = OrderedDict()
+            self.frequent = OrderedDict()
+            self.recent_ghosts = OrderedDict()
+            self.frequent_ghosts = OrderedDict()
+            self.target = 0
+            self.incoming = None
+        except Exception as e:
+            print(f"Error in initialization: {e}")
+
+    def __adapt(self, key):
+        """
+        Moves the recency target towards the ghost list
+        that the incoming key was found in.
+        """
+        self.incoming = key
+        recent, frequent = len(self.recent_ghosts), len(self.frequent_ghosts)
+        if key in self.recent_ghosts:
+            step = max(frequent / recent, 1)
+            self.target = min(self.max_items, self.target + step)
+        elif key in self.frequent_ghosts:
+            step = max(recent / frequent, 1)
+            self.target = max(0, self.target - step)
+
+    def __trim_ghosts(self):
+        """
+        Bounds the ghost lists to the size of the cache.
+        """
+        while (self.recent_ghosts and
+               len(self.recent) + len(self.recent_ghosts) > self.max_items):
+            self.recent_ghosts.popitem(last=False)
+        while (len(self.recent) + len(self.frequent) +
+               len(self.recent_ghosts) + len(self.frequent_ghosts) >
+               2 * self.max_items):
+            if self.frequent_ghosts:
+                self.frequent_ghosts.popitem(last=False)
+            else:
+                self.recent_ghosts.popitem(last=False)
+
+    def _write(self, key, item, ttl=None):
+        """
+        Adapts to ghost hits before room is made for a new key.
+        """
+        if key not in self.cache_data:
+            self.__adapt(key)
+        return super()._write(key, item, ttl)
+
+    def _insert(self, key, item):
+        """
+        Stores a new key, in the frequency list when it was
+        recently evicted and in the recency list otherwise.
+        """
+        if self.incoming != key:
+            self.__adapt(key)
+        self.incoming = None
+        self.cache_data[key] = item
+        if key in self.recent_ghosts:
+            del self.recent_ghosts[key]
+            self.frequent[key] = None
+        elif key in self.frequent_ghosts:
+            del self.frequent_ghosts[key]
+            self.frequent[key] = None
+        else:
+            self.recent[key] = None
+            self.__trim_ghosts()
+
+    def _update(self, key, item):
+        """
+        Replaces an item, counting the put as a use.
+        """
+        self.cache_data[key] = item
+        self._touch(key)
+
+    def _touch(self, key):
+        """
+        Promotes a key to the most recent end of the
+        frequency list.
+        """
+        if key in self.recent:
+            del self.recent[key]
+            self.frequent[key] = None
+        else:
+            self.frequent.move_to_end(key)
+
+    def _entries(self):
+        """
+        Yields the keys of each list from its least recently
+        used end, tagged with whether they are frequent.
+        """
+        for key in self.recent:
+            yield key, False
+        for key in self.frequent:
+            yield key, True
+
+    def _restore(self, key, item, frequent):
+        """
+        Stores a key read from a snapshot at the end of its list.
+        """
+        self.cache_data[key] = item
+        if frequent:
+            self.frequent[key] = None
+        else:
+            self.recent[key] = None
+
+    def _policy_state(self):
+        """
+        Returns the recency target and the ghost lists.
+        """
+        return (self.target, list(self.recent_ghosts),
+                list(self.frequent_ghosts))
+
+    def _restore_policy_state(self, state):
+        """
+        Restores the recency target and the ghost lists.
+        """
+        target, recent_ghosts, frequent_ghosts = state
+        self.target = min(self.max_items, target)
+        self.recent_ghosts = OrderedDict.fromkeys(recent_ghosts)
+        self.frequent_ghosts = OrderedDict.fromkeys(frequent_ghosts)
+
+    def _evict(self):
+        """
+        Removes the least recently used key of the list that
+        is over its target and remembers it as a ghost.
+        """
+        recent = len(self.recent)
+        if self.recent and (
+                recent > self.target or not self.frequent or
+                (recent == self.target and
+                 self.incoming in self.frequent_ghosts)):
+            key, _ = self.recent.popitem(last=False)
+            self.recent_ghosts[key] = None
+        else:
+            key, _ = self.frequent.popitem(last=False)
+            self.frequent_ghosts[key] = None
+        return key, self.cache_data.pop(key)
+
+    def _forget(self, key):
+        """
+        Removes an expired or deleted key without a ghost.
+        """
+        if key in self.recent:
+            del self.recent[key]
+        else:
+            del self.frequent[key]
+
+    def put(self, key, item, ttl=None):
+        """
+        Adds an item in the cache, expiring after ttl seconds
+        (or the default ttl) when one is given.
+        """
+        try:
+            if key is None or item is None:
+                return
+            self._store(key, item, ttl)
+        except Exception as e:
+            print(f"Error in put method: {e}")
+
+    def get(self, key):
+        """
+        Retrieves an item by key.
+        """
+        try:
+            return self._fetch(key)
+        except Exception as e:
+            print(f"Error in get method: {e}")
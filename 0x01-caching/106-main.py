@@ -0,0 +1,46 @@
+#!/usr/bin/python3
+""" 106-main """
+import random
+
+ARCCache = __import__('106-arc_cache').ARCCache
+policies = {
+    "FIFO": __import__('1-fifo_cache').FIFOCache,
+    "LIFO": __import__('2-lifo_cache').LIFOCache,
+    "LRU": __import__('3-lru_cache').LRUCache,
+    "MRU": __import__('4-mru_cache').MRUCache,
+    "LFU": __import__('100-lfu_cache').LFUCache,
+    "ARC": ARCCache,
+}
+
+my_cache = ARCCache()
+my_cache.put("A", "Hello")
+my_cache.put("B", "World")
+my_cache.put("C", "Holberton")
+my_cache.put("D", "School")
+print(my_cache.get("B"))
+my_cache.put("E", "Battery")
+my_cache.print_cache()
+my_cache.put("A", "Street")
+my_cache.print_cache()
+
+
+def trace(length=200000, seed=0):
+    """ A hot set of 80 keys, interrupted by long one-off scans,
+    whose hot set moves halfway through """
+    rand = random.Random(seed)
+    scan = 1000
+    for i in range(length):
+        if i % 5000 < 1000:
+            scan += 1
+            yield "scan{}".format(scan)
+        else:
+            yield "hot{}".format(rand.randrange(80) + 80 * (i > length // 2))
+
+
+print("policy  hit ratio")
+for name, policy in policies.items():
+    cache = policy(max_items=100, on_evict=lambda key, item: None)
+    for key in trace():
+        if cache.get(key) is None:
+            cache.put(key, key)
+    print("{:6}  {:.3f}".format(name, cache.snapshot()["hit_ratio"]))
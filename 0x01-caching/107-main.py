@@ -0,0 +1,31 @@
+#!/usr/bin/python3
+""" 107-main """
+import itertools
+import random
+
+TinyLFUCache = __import__('107-tinylfu_cache').TinyLFUCache
+policies = {
+    "LRU": __import__('3-lru_cache').LRUCache,
+    "LFU": __import__('100-lfu_cache').LFUCache,
+    "ARC": __import__('106-arc_cache').ARCCache,
+    "TinyLFU": TinyLFUCache,
+}
+
+my_cache = TinyLFUCache()
+for key in "ABCDAAE":
+    if my_cache.get(key) is None:
+        my_cache.put(key, key.lower())
+my_cache.print_cache()
+print(len(my_cache.sketch.table), "sketch bytes")
+
+rand = random.Random(0)
+weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(50000)))
+trace = rand.choices(range(50000), cum_weights=weights, k=300000)
+
+print("policy   hit ratio")
+for name, policy in policies.items():
+    cache = policy(max_items=500, on_evict=lambda key, item: None)
+    for key in trace:
+        if cache.get(key) is None:
+            cache.put(key, key)
+    print("{:7}  {:.3f}".format(name, cache.snapshot()["hit_ratio"]))
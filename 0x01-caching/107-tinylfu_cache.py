@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+
+"""
+Window TinyLFU caching module.
+
+This module provides a TinyLFUCache class for
+implementing a caching system
+with a W-TinyLFU admission and eviction policy.
+
+New keys enter a small LRU window. When the window
+overflows, its oldest key competes with the victim of
+a segmented LRU main area (probation and protected
+segments) and is only admitted if a count-min sketch
+estimates that it is used more often. The sketch keeps
+one byte per counter, four counters per tracked key,
+and halves all counters periodically so that old
+popularity fades.
+"""
+
+from collections import OrderedDict
+from base_caching import BaseCaching
+
+MASK64 = (1 << 64) - 1
+SEED = 0x9E3779B97F4A7C15
+DEPTH = 4
+HALVE = bytes(i >> 1 for i in range(256))
+HASH_PROBE = "tinylfu"
+
+
+class CountMinSketch():
+    """
+    Represents approximate use counts of many keys in a
+    fixed number of saturating counters.
+    """
+    MAX_COUNT = 15
+
+    def __init__(self, capacity):
+        """
+        Initializes the sketch.
+
+        Args:
+            capacity (int): Number of keys the counts should
+                stay accurate for.
+        """
+        self.width = 1 << max(4, capacity - 1).bit_length()
+        self.mask = self.width - 1
+        self.table = bytearray(self.width * DEPTH)
+        self.additions = 0
+        self.sample_size = 10 * self.width
+
+    def __indexes(self, key):
+        """
+        Returns the counter position of a key in each row,
+        derived from one mixed hash by double hashing.
+        """
+        x = (hash(key) * SEED) & MASK64
+        step = (x & 0xFFFFFFFF) | 1
+        x >>= 32
+        mask, width = self.mask, self.width
+        return (x & mask, width + ((x + step) & mask),
+                2 * width + ((x + 2 * step) & mask),
+                3 * width + ((x + 3 * step) & mask))
+
+    def estimate(self, key):
+        """
+        Returns the estimated use count of a key.
+        """
+        table = self.table
+        a, b, c, d = self.__indexes(key)
+        return min(table[a], table[b], table[c], table[d])
+
+    def increment(self, key):
+        """
+        Counts one use of a key, aging the sketch once
+        enough uses have been counted.
+        """
+        table = self.table
+        for i in self.__indexes(key):
+            if table[i] < self.MAX_COUNT:
+                table[i] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self.table = table.translate(HALVE)
+            self.additions //= 2
+
+
+class TinyLFUCache(BaseCaching):
+    """
+    Represents an object that allows storing and
+    retrieving items from a dictionary with a W-TinyLFU
+    removal mechanism when the limit is reached.
+    """
+    WINDOW_RATIO = 0.01
+    PROTECTED_RATIO = 0.8
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initializes the cache, accepting the same capacity
+        arguments as BaseCaching.
+        """
+        try:
+            super().__init__(*args, **kwargs)
+            self.window = OrderedDict()
+            self.probation = OrderedDict()
+            self.protected = OrderedDict()
+            self.window_size = max(
+                1, int(self.max_items * self.WINDOW_RATIO))
+            main_size = max(0, self.max_items - self.window_size)
+            self.protected_size = int(main_size * self.PROTECTED_RATIO)
+            self.sketch = CountMinSketch(self.max_items)
+        except Exception as e:
+            print(f"Error in initialization: {e}")
+
+    def _lookup(self, key):
+        """
+        Counts every lookup in the sketch, hit or miss.
+        """
+        if key is not None:
+            self.sketch.increment(key)
+        return super()._lookup(key)
+
+    def _insert(self, key, item):
+        """
+        Stores a new key at the most recent end of the window,
+        moving the oldest window key to probation on overflow.
+        """
+        self.cache_data[key] = item
+        self.sketch.increment(key)
+        self.window[key] = None
+        if len(self.window) > self.window_size:
+            candidate, _ = self.window.popitem(last=False)
+            self.probation[candidate] = None
+
+    def _update(self, key, item):
+        """
+        Replaces an item, counting the put as a use.
+        """
+        self.cache_data[key] = item
+        self.sketch.increment(key)
+        self._touch(key)
+
+    def _touch(self, key):
+        """
+        Marks a key as recently used, promoting it from
+        probation to the protected segment.
+        """
+        if key in self.window:
+            self.window.move_to_end(key)
+        elif key in self.protected:
+            self.protected.move_to_end(key)
+        else:
+            del self.probation[key]
+            self.protected[key] = None
+            if len(self.protected) > self.protected_size:
+                demoted, _ = self.protected.popitem(last=False)
+                self.probation[demoted] = None
+
+    def _entries(self):
+        """
+        Yields the keys of each segment from its oldest end,
+        tagged with the position of the segment.
+        """
+        for position, segment in enumerate(
+                (self.window, self.probation, self.protected)):
+            for key in segment:
+                yield key, position
+
+    def _restore(self, key, item, position):
+        """
+        Stores a key read from a snapshot at the end of its
+        segment.
+        """
+        self.cache_data[key] = item
+        (self.window, self.probation, self.protected)[position][key] = None
+
+    def _policy_state(self):
+        """
+        Returns the counters of the sketch, with a probe of the
+        string hash they were counted under.
+        """
+        return (hash(HASH_PROBE), self.sketch.width,
+                bytes(self.sketch.table), self.sketch.additions)
+
+    def _restore_policy_state(self, state):
+        """
+        Restores the counters of the sketch when it has the
+        same width and string hashes are seeded the same way,
+        starting from a cold sketch otherwise.
+        """
+        probe, width, table, additions = state
+        if probe == hash(HASH_PROBE) and width == self.sketch.width:
+            self.sketch.table = bytearray(table)
+            self.sketch.additions = additions
+
+    def _evict(self):
+        """
+        Lets the oldest window key and the main area victim
+        compete, removes the one with the lower estimated
+        frequency and returns it with its item.
+        """
+        main = self.probation or self.protected
+        if self.window and (not main or
+                            len(self.window) >= self.window_size):
+            candidate, _ = self.window.popitem(last=False)
+            if not main or (self.sketch.estimate(candidate) <=
+                            self.sketch.estimate(next(iter(main)))):
+                return candidate, self.cache_data.pop(candidate)
+            self.probation[candidate] = None
+        victim, _ = main.popitem(last=False)
+        return victim, self.cache_data.pop(victim)
+
+    def _forget(self, key):
+        """
+        Removes an expired or deleted key from its segment.
+        """
+        for segment in (self.window, self.probation, self.protected):
+            if key in segment:
+                del segment[key]
+                return
+
+    def put(self, key, item, ttl=None):
+        """
+        Adds an item in the cache, expiring after ttl seconds
+        (or the default ttl) when one is given.
+        """
+        try:
+            if key is None or item is None:
+                return
+            self._store(key, item, ttl)
+        except Exception as e:
+            print(f"Error in put method: {e}")
+
+    def get(self, key):
+        """
+        Retrieves an item by key.
+        """
+        try:
+            return self._fetch(key)
+        except Exception as e:
+            print(f"Error in get method: {e}")
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+
+"""
+Trace-replay benchmark module.
+
+This module replays key traces through the caching
+policies and reports, for each policy and capacity,
+the hit ratio, the throughput in operations per second
+and the peak memory allocated during the replay.
+
+Usage:
+    ./108-benchmark.py [-c CAPACITY ...] [-t TRACE ...]
+                       [-f FILE ...] [-n LENGTH] [-k KEYS]
+"""
+
+import argparse
+import itertools
+import random
+import time
+import tracemalloc
+from typing import Dict, Iterable, List
+
+POLICIES = {
+    "FIFO": __import__('1-fifo_cache').FIFOCache,
+    "LIFO": __import__('2-lifo_cache').LIFOCache,
+    "LRU": __import__('3-lru_cache').LRUCache,
+    "MRU": __import__('4-mru_cache').MRUCache,
+    "LFU": __import__('100-lfu_cache').LFUCache,
+    "ARC": __import__('106-arc_cache').ARCCache,
+    "TinyLFU": __import__('107-tinylfu_cache').TinyLFUCache,
+}
+
+
+def zipf_trace(length: int, keys: int, skew: float = 1.0,
+               seed: int = 0) -> List[int]:
+    """
+    Returns keys drawn with a probability proportional to
+    1 / rank ** skew.
+    """
+    rand = random.Random(seed)
+    weights = list(itertools.accumulate(
+        1 / (rank + 1) ** skew for rank in range(keys)))
+    return rand.choices(range(keys), cum_weights=weights, k=length)
+
+
+def scan_trace(length: int, keys: int, seed: int = 0) -> List[int]:
+    """
+    Returns a single sequential pass over distinct keys.
+    """
+    return list(range(length))
+
+
+def loop_trace(length: int, keys: int, seed: int = 0) -> List[int]:
+    """
+    Returns repeated sequential passes over the same keys.
+    """
+    return [i % keys for i in range(length)]
+
+
+def mixed_trace(length: int, keys: int, seed: int = 0) -> List[int]:
+    """
+    Returns a Zipf workload where one request in five
+    belongs to a one-off scan.
+    """
+    rand = random.Random(seed)
+    hot = zipf_trace(length, keys, seed=seed)
+    scan = itertools.count(keys)
+    return [next(scan) if rand.random() < 0.2 else key for key in hot]
+
+
+TRACES = {
+    "zipf": zipf_trace,
+    "scan": scan_trace,
+    "loop": loop_trace,
+    "mixed": mixed_trace,
+}
+
+
+def read_trace(path: str) -> List[str]:
+    """
+    Reads a recorded trace holding one key per line.
+    """
+    with open(path) as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def run(cache, trace: Iterable) -> int:
+    """
+    Looks each key of a trace up, putting the missed ones,
+    and returns the number of cache operations.
+    """
+    ops = 0
+    for key in trace:
+        ops += 1
+        if cache.get(key) is None:
+            cache.put(key, key)
+            ops += 1
+    return ops
+
+
+def replay(policy, trace: Iterable, capacity: int) -> Dict:
+    """
+    Replays a trace through a new cache of a policy.
+
+    The trace is replayed twice, once timed and once under
+    tracemalloc, so that tracing does not skew throughput.
+
+    Returns:
+        Dict: The hit ratio, operations per second and
+        peak memory in bytes of the replay.
+    """
+    def discard(key, item):
+        """ Ignores evictions """
+
+    cache = policy(max_items=capacity, on_evict=discard)
+    start = time.perf_counter()
+    ops = run(cache, trace)
+    elapsed = time.perf_counter() - start
+    hit_ratio = cache.snapshot()["hit_ratio"]
+    del cache
+    tracemalloc.start()
+    run(policy(max_items=capacity, on_evict=discard), trace)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "hit_ratio": hit_ratio,
+        "ops_per_sec": ops / elapsed if elapsed else 0.0,
+        "peak_bytes": peak,
+    }
+
+
+def main() -> None:
+    """
+    Runs every policy on the requested traces and
+    capacities and prints one row per replay.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("-c", "--capacity", type=int, nargs="+",
+                        default=[100, 1000])
+    parser.add_argument("-t", "--trace", nargs="+", choices=TRACES,
+                        default=list(TRACES))
+    parser.add_argument("-f", "--file", nargs="+", default=[],
+                        help="recorded traces, one key per line")
+    parser.add_argument("-p", "--policy", nargs="+", choices=POLICIES,
+                        default=list(POLICIES))
+    parser.add_argument("-n", "--length", type=int, default=100000)
+    parser.add_argument("-k", "--keys", type=int, default=10000)
+    args = parser.parse_args()
+
+    traces = {name: TRACES[name](args.length, args.keys)
+              for name in args.trace}
+    for path in args.file:
+        traces[path] = read_trace(path)
+
+    print("{:10} {:>8} {:8} {:>9} {:>12} {:>11}".format(
+        "trace", "capacity", "policy", "hit ratio", "ops/sec", "peak KiB"))
+    for (name, trace), capacity in itertools.product(traces.items(),
+                                                     args.capacity):
+        for policy in args.policy:
+            result = replay(POLICIES[policy], trace, capacity)
+            print("{:10} {:8d} {:8} {:9.3f} {:12.0f} {:11.1f}".format(
+                name[-10:], capacity, policy, result["hit_ratio"],
+                result["ops_per_sec"], result["peak_bytes"] / 1024))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+
+"""
+Compact caching module.
+
+This module provides a SlotMap class, a mapping whose
+keys, items and links live in parallel preallocated
+arrays indexed by slot, and a CompactLFUCache class
+that threads its frequency buckets through those links
+instead of keeping a dictionary and an ordered set per
+key. Freed slots are chained in a free list and reused.
+"""
+
+from array import array
+from collections.abc import MutableMapping
+from base_caching import BaseCaching
+
+NIL = -1
+PREALLOCATED = 1 << 20
+
+
+class SlotMap(MutableMapping):
+    """
+    Represents a mapping storing each entry in a slot of
+    parallel arrays: slot_keys, slot_items, and the prev
+    and next links that the owning policy is free to use.
+    The next links of free slots form the free list.
+    """
+    __slots__ = ("index", "slot_keys", "slot_items", "prev", "next", "free")
+
+    def __init__(self, capacity=0):
+        """
+        Initializes the map with capacity free slots.
+        """
+        self.index = {}
+        self.slot_keys = []
+        self.slot_items = []
+        self.prev = array("i")
+        self.next = array("i")
+        self.free = NIL
+        self.grow(max(1, capacity))
+
+    def grow(self, count):
+        """
+        Adds count free slots.
+        """
+        start = len(self.slot_keys)
+        self.slot_keys.extend([None] * count)
+        self.slot_items.extend([None] * count)
+        self.prev.extend([NIL] * count)
+        self.next.extend(range(start + 1, start + count + 1))
+        self.next[-1] = self.free
+        self.free = start
+
+    def allocate(self, key, item):
+        """
+        Stores a new key in a free slot and returns the slot.
+        """
+        if self.free == NIL:
+            self.grow(len(self.slot_keys))
+        slot = self.free
+        self.free = self.next[slot]
+        self.slot_keys[slot] = key
+        self.slot_items[slot] = item
+        self.index[key] = slot
+        return slot
+
+    def __getitem__(self, key):
+        """
+        Returns the item of a key.
+        """
+        return self.slot_items[self.index[key]]
+
+    def __setitem__(self, key, item):
+        """
+        Replaces the item of a key, allocating a slot if new.
+        """
+        slot = self.index.get(key)
+        if slot is None:
+            self.allocate(key, item)
+        else:
+            self.slot_items[slot] = item
+
+    def __delitem__(self, key):
+        """
+        Removes a key and puts its slot on the free list.
+        """
+        slot = self.index.pop(key)
+        self.slot_keys[slot] = None
+        self.slot_items[slot] = None
+        self.next[slot] = self.free
+        self.free = slot
+
+    def __contains__(self, key):
+        """
+        Whether a key is stored.
+        """
+        return key in self.index
+
+    def __iter__(self):
+        """
+        Iterates over the stored keys.
+        """
+        return iter(self.index)
+
+    def __len__(self):
+        """
+        Returns the number of stored keys.
+        """
+        return len(self.index)
+
+
+class CompactLFUCache(BaseCaching):
+    """
+    Represents an object that allows storing and
+    retrieving items from a SlotMap with a LFU
+    removal mechanism when the limit is reached.
+    Among keys with the same frequency, the least
+    recently used one is removed first.
+    """
+    def __init__(self, *args, **kwargs):
+        """
+        Initializes the cache, accepting the same capacity
+        arguments as BaseCaching.
+        """
+        try:
+            super().__init__(*args, **kwargs)
+            self.cache_data = SlotMap(min(self.max_items, PREALLOCATED))
+            self.freq = array("I")
+            self.heads = {}
+            self.tails = {}
+            self.min_freq = 0
+        except Exception as e:
+            print(f"Error in initialization: {e}")
+
+    def __link(self, slot, freq):
+        """
+        Appends a slot to the bucket of a frequency.
+        """
+        data = self.cache_data
+        tail = self.tails.get(freq, NIL)
+        data.prev[slot] = tail
+        data.next[slot] = NIL
+        if tail == NIL:
+            self.heads[freq] = slot
+        else:
+            data.next[tail] = slot
+        self.tails[freq] = slot
+        self.freq[slot] = freq
+
+    def __unlink(self, slot):
+        """
+        Removes a slot from its bucket and returns whether
+        the bucket became empty.
+        """
+        data = self.cache_data
+        freq = self.freq[slot]
+        prev, nxt = data.prev[slot], data.next[slot]
+        if prev == NIL:
+            self.heads[freq] = nxt
+        else:
+            data.next[prev] = nxt
+        if nxt == NIL:
+            self.tails[freq] = prev
+        else:
+            data.prev[nxt] = prev
+        if self.heads[freq] == NIL:
+            del self.heads[freq]
+            del self.tails[freq]
+            return True
+        return False
+
+    def __increment(self, slot):
+        """
+        Moves a slot to the end of the next frequency bucket.
+        """
+        freq = self.freq[slot]
+        if self.__unlink(slot) and self.min_freq == freq:
+            self.min_freq = freq + 1
+        self.__link(slot, freq + 1)
+
+    def _insert(self, key, item):
+        """
+        Stores a new key in the bucket of frequency zero.
+        """
+        slot = self.cache_data.allocate(key, item)
+        if slot >= len(self.freq):
+            self.freq.extend([0] * (len(self.cache_data.slot_keys) -
+                                    len(self.freq)))
+        self.__link(slot, 0)
+        self.min_freq = 0
+
+    def _update(self, key, item):
+        """
+        Replaces an item, counting the put as a use.
+        """
+        slot = self.cache_data.index[key]
+        self.cache_data.slot_items[slot] = item
+        self.__increment(slot)
+
+    def _touch(self, key):
+        """
+        Counts a hit as a use.
+        """
+        self.__increment(self.cache_data.index[key])
+
+    def _entries(self):
+        """
+        Yields the keys bucket by bucket, from the lowest
+        frequency, with their frequency.
+        """
+        data = self.cache_data
+        for freq in sorted(self.heads):
+            slot = self.heads[freq]
+            while slot != NIL:
+                yield data.slot_keys[slot], freq
+                slot = data.next[slot]
+
+    def _restore(self, key, item, freq):
+        """
+        Stores a key read from a snapshot at the end of the
+        bucket of its saved frequency. A stale min_freq is
+        never above the lowest stored frequency, so taking
+        the lower of the two keeps it that way.
+        """
+        self.min_freq = min(self.min_freq, freq)
+        slot = self.cache_data.allocate(key, item)
+        if slot >= len(self.freq):
+            self.freq.extend([0] * (len(self.cache_data.slot_keys) -
+                                    len(self.freq)))
+        self.__link(slot, freq)
+
+    def _evict(self):
+        """
+        Removes the least recently used key of the lowest
+        frequency and returns it with its item, looking the
+        lowest frequency up only if its bucket emptied since
+        the last insert.
+        """
+        data = self.cache_data
+        if self.min_freq not in self.heads:
+            self.min_freq = min(self.heads)
+        slot = self.heads[self.min_freq]
+        key, item = data.slot_keys[slot], data.slot_items[slot]
+        self.__unlink(slot)
+        del data[key]
+        return key, item
+
+    def _forget(self, key):
+        """
+        Removes an expired or deleted key from its bucket.
+        """
+        self.__unlink(self.cache_data.index[key])
+
+    def put(self, key, item, ttl=None):
+        """
+        Adds an item in the cache, expiring after ttl seconds
+        (or the default ttl) when one is given.
+        """
+        try:
+            if key is None or item is None:
+                return
+            self._store(key, item, ttl)
+        except Exception as e:
+            print(f"Error in put method: {e}")
+
+    def get(self, key):
+        """
+        Retrieves an item by key.
+        """
+        try:
+            return self._fetch(key)
+        except Exception as e:
+            print(f"Error in get method: {e}")
@@ -0,0 +1,35 @@
+#!/usr/bin/python3
+""" 109-main """
+import sys
+import tracemalloc
+
+CompactLFUCache = __import__('109-compact_cache').CompactLFUCache
+policies = {
+    "LRUCache": __import__('3-lru_cache').LRUCache,
+    "LFUCache": __import__('100-lfu_cache').LFUCache,
+    "CompactLFUCache": CompactLFUCache,
+}
+
+my_cache = CompactLFUCache()
+my_cache.put("A", "Hello")
+my_cache.put("B", "World")
+my_cache.put("C", "Holberton")
+my_cache.put("D", "School")
+print(my_cache.get("B"))
+my_cache.put("E", "Battery")
+my_cache.print_cache()
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+keys = list(range(1 << 20, (1 << 20) + count))
+print("bytes per entry at {} keys, excluding keys and items".format(count))
+for name, policy in policies.items():
+    tracemalloc.start()
+    cache = policy(max_items=count)
+    for key in keys:
+        cache.put(key, True)
+    for key in keys[::2]:
+        cache.get(key)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del cache
+    print("{:16} {:6.1f}".format(name, used / count))
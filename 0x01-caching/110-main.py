@@ -0,0 +1,34 @@
+#!/usr/bin/python3
+""" 110-main """
+import multiprocessing
+import os
+import tempfile
+
+SharedCache = __import__('110-shared_cache').SharedCache
+
+path = os.path.join(tempfile.mkdtemp(), "cache")
+
+
+def worker(number):
+    """ Puts one key per worker and reads the others' """
+    cache = SharedCache(path)
+    cache.put("worker{}".format(number), "pid {}".format(os.getpid()))
+    cache.close()
+
+
+my_cache = SharedCache(path, max_items=16, ways=4)
+processes = [multiprocessing.Process(target=worker, args=(i,))
+             for i in range(4)]
+for p in processes:
+    p.start()
+for p in processes:
+    p.join()
+print(sorted(my_cache.cache_data))
+print(my_cache.get("worker2") is not None)
+print(my_cache.get("worker9"))
+for key in range(40):
+    my_cache.put(key, key * key)
+print(len(my_cache.cache_data), my_cache.max_items)
+print(my_cache.snapshot())
+my_cache.close()
+os.remove(path)
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+
+"""
+Shared-memory caching module.
+
+This module provides a SharedCache class whose entries
+live in a memory-mapped file, so that every process on
+a host that opens the same path shares one cache.
+
+The file holds a header followed by a fixed-slot hash
+table split in buckets of a few ways. A key hashes to a
+bucket, and when the bucket is full the least recently
+(LRU) or least frequently (LFU) used way is replaced.
+Keys and items are pickled into the slot, and an flock
+on the file serializes processes. flock locks belong to
+an open file, which a forked child shares with its
+parent, so children reopen the file of every cache they
+inherit. Since slots are unpickled, the file must be
+owned by the current user.
+"""
+
+import fcntl
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+import threading
+import time
+import weakref
+from base_caching import BaseCaching, print_discard
+
+MAGIC = b"ALXCACHE"
+VERSION = 1
+HEADER = struct.Struct("<8sIIII5Q")
+SLOT = struct.Struct("<QQIdII")
+COUNTERS = ("hits", "misses", "insertions", "evictions")
+
+OPEN_CACHES = weakref.WeakSet()
+
+
+def reopen_after_fork():
+    """
+    Gives every cache inherited by a forked child its own
+    open file and thread lock.
+    """
+    for cache in list(OPEN_CACHES):
+        try:
+            cache.reopen()
+        except OSError as e:
+            print(f"Error reopening {cache.path}: {e}")
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=reopen_after_fork)
+
+
+class SharedCache():
+    """
+    Represents a cache shared between processes through a
+    memory-mapped file, with the get/put contract of the
+    BaseCaching policies.
+    """
+    def __init__(self, path, max_items=None, ways=8, slot_size=256,
+                 policy="lru", default_ttl=None, on_evict=None):
+        """
+        Opens the cache file, creating it if needed.
+
+        Args:
+            path (str): The backing file, shared by all processes,
+                in a directory other users cannot write to.
+            max_items (int): Number of slots, rounded up to a
+                multiple of ways; ignored if the file exists.
+            ways (int): Slots per bucket.
+            slot_size (int): Bytes per slot, bounding the size
+                of a pickled key and item.
+            policy (str): "lru" or "lfu" replacement within a bucket.
+            default_ttl (float): Seconds an item lives when put
+                without its own ttl.
+            on_evict (callable): Called with the key and item of
+                each evicted entry, defaults to print_discard.
+        """
+        assert policy in ("lru", "lfu"), "Policy must be lru or lfu."
+        assert path, "Path must be given."
+        if max_items is None:
+            max_items = BaseCaching.MAX_ITEMS
+        self.path = path
+        self.policy = policy
+        self.default_ttl = default_ttl
+        self.on_evict = print_discard if on_evict is None else on_evict
+        self.thread_lock = threading.Lock()
+        self.fd = self.__open(os.O_CREAT)
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self.fd).st_size == 0:
+                buckets = max(1, -(-max_items // ways))
+                size = HEADER.size + buckets * ways * slot_size
+                os.ftruncate(self.fd, size)
+                os.pwrite(self.fd, HEADER.pack(MAGIC, VERSION, buckets,
+                                               ways, slot_size,
+                                               0, 0, 0, 0, 0), 0)
+            header = os.pread(self.fd, HEADER.size, 0)
+            magic, version, buckets, ways, slot_size = HEADER.unpack(
+                header)[:5]
+            if magic != MAGIC or version != VERSION:
+                raise ValueError("{} is not a cache file".format(path))
+            self.buckets, self.ways, self.slot_size = buckets, ways, slot_size
+            self.max_items = buckets * ways
+            self.map = mmap.mmap(self.fd, 0)
+        finally:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+        OPEN_CACHES.add(self)
+
+    def __open(self, flags=0):
+        """
+        Opens the cache file, without following a symbolic
+        link, and checks that it belongs to the current user.
+
+        Raises:
+            PermissionError: If another user owns the file.
+        """
+        fd = os.open(self.path, os.O_RDWR | os.O_NOFOLLOW | flags, 0o600)
+        if os.fstat(fd).st_uid != os.geteuid():
+            os.close(fd)
+            raise PermissionError(
+                "{} is owned by another user".format(self.path))
+        return fd
+
+    def reopen(self):
+        """
+        Replaces the open file and thread lock inherited from
+        the parent process by new ones, so that the file lock
+        excludes the parent again.
+        """
+        fd = self.__open()
+        os.close(self.fd)
+        self.fd = fd
+        self.thread_lock = threading.Lock()
+
+    def close(self):
+        """
+        Unmaps and closes the cache file.
+        """
+        OPEN_CACHES.discard(self)
+        self.map.close()
+        os.close(self.fd)
+
+    def __enter__(self):
+        """
+        Holds the thread and process locks.
+        """
+        self.thread_lock.acquire()
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        """
+        Releases the process and thread locks.
+        """
+        fcntl.flock(self.fd, fcntl.LOCK_UN)
+        self.thread_lock.release()
+
+    def __header(self, index):
+        """
+        Returns the offset of a counter of the header, where
+        index 0 is the clock.
+        """
+        return HEADER.size - 8 * (5 - index)
+
+    def __bump(self, index, step=1):
+        """
+        Adds step to a header counter and returns the new value.
+        """
+        offset = self.__header(index)
+        value = struct.unpack_from("<Q", self.map, offset)[0] + step
+        struct.pack_into("<Q", self.map, offset, value)
+        return value
+
+    def __slots(self, key_bytes):
+        """
+        Returns the hash of a key and the offsets of the slots
+        of its bucket.
+        """
+        digest = hashlib.blake2b(key_bytes, digest_size=8).digest()
+        key_hash = int.from_bytes(digest, "little") or 1
+        first = HEADER.size + (key_hash % self.buckets) * self.ways * \
+            self.slot_size
+        return key_hash, range(first, first + self.ways * self.slot_size,
+                               self.slot_size)
+
+    def __find(self, key_hash, key_bytes, offsets):
+        """
+        Returns the offset of the slot holding a key, or None.
+        """
+        for offset in offsets:
+            slot_hash, _, _, _, length, _ = SLOT.unpack_from(self.map, offset)
+            if slot_hash == key_hash and length == len(key_bytes):
+                start = offset + SLOT.size
+                if self.map[start:start + length] == key_bytes:
+                    return offset
+        return None
+
+    def __read(self, offset):
+        """
+        Returns the key and item stored in a slot.
+        """
+        _, _, _, _, key_length, item_length = SLOT.unpack_from(
+            self.map, offset)
+        start = offset + SLOT.size
+        key = pickle.loads(self.map[start:start + key_length])
+        start += key_length
+        return key, pickle.loads(self.map[start:start + item_length])
+
+    def put(self, key, item, ttl=None):
+        """
+        Adds an item in the cache, expiring after ttl seconds
+        (or the default ttl) when one is given. Items whose
+        pickled key and item exceed a slot are not cached.
+        """
+        if key is None or item is None:
+            return
+        key_bytes = pickle.dumps(key)
+        item_bytes = pickle.dumps(item)
+        if SLOT.size + len(key_bytes) + len(item_bytes) > self.slot_size:
+            return
+        if ttl is None:
+            ttl = self.default_ttl
+        expires = 0.0 if ttl is None else time.time() + ttl
+        key_hash, offsets = self.__slots(key_bytes)
+        evicted = None
+        with self:
+            stamp = self.__bump(0)
+            offset = self.__find(key_hash, key_bytes, offsets)
+            count = 0
+            if offset is not None:
+                count = SLOT.unpack_from(self.map, offset)[2] + 1
+            else:
+                offset = self.__victim(offsets)
+                if SLOT.unpack_from(self.map, offset)[0]:
+                    if not self.__expired(offset):
+                        evicted = self.__read(offset)
+                        self.__bump(4)
+                self.__bump(3)
+            SLOT.pack_into(self.map, offset, key_hash, stamp, count, expires,
+                           len(key_bytes), len(item_bytes))
+            start = offset + SLOT.size
+            self.map[start:start + len(key_bytes) + len(item_bytes)] = \
+                key_bytes + item_bytes
+        if evicted is not None:
+            self.on_evict(*evicted)
+
+    def __expired(self, offset):
+        """
+        Whether the entry of a slot has expired.
+        """
+        expires = SLOT.unpack_from(self.map, offset)[3]
+        return expires and expires <= time.time()
+
+    def __victim(self, offsets):
+        """
+        Returns the offset of an empty or expired slot of the
+        bucket, or else of its least recently or least
+        frequently used one.
+        """
+        best, best_rank = None, None
+        for offset in offsets:
+            slot_hash, stamp, count, _, _, _ = SLOT.unpack_from(
+                self.map, offset)
+            if not slot_hash or self.__expired(offset):
+                return offset
+            rank = (count, stamp) if self.policy == "lfu" else stamp
+            if best is None or rank < best_rank:
+                best, best_rank = offset, rank
+        return best
+
+    def get(self, key):
+        """
+        Retrieves an item by key.
+        """
+        if key is None:
+            return None
+        key_bytes = pickle.dumps(key)
+        key_hash, offsets = self.__slots(key_bytes)
+        with self:
+            offset = self.__find(key_hash, key_bytes, offsets)
+            if offset is not None and self.__expired(offset):
+                SLOT.pack_into(self.map, offset, 0, 0, 0, 0.0, 0, 0)
+                offset = None
+            if offset is None:
+                self.__bump(2)
+                return None
+            self.__bump(1)
+            _, _, count, expires, key_length, item_length = \
+                SLOT.unpack_from(self.map, offset)
+            SLOT.pack_into(self.map, offset, key_hash, self.__bump(0),
+                           count + 1, expires, key_length, item_length)
+            return self.__read(offset)[1]
+
+    @property
+    def cache_data(self):
+        """
+        A copy of the unexpired items of the cache.
+        """
+        data = {}
+        with self:
+            for offset in range(HEADER.size, len(self.map), self.slot_size):
+                if (SLOT.unpack_from(self.map, offset)[0] and
+                        not self.__expired(offset)):
+                    key, item = self.__read(offset)
+                    data[key] = item
+        return data
+
+    def print_cache(self):
+        """
+        Prints the cache.
+        """
+        data = self.cache_data
+        print("Current cache:")
+        for key in sorted(data.keys()):
+            print("{}: {}".format(key, data.get(key)))
+
+    def snapshot(self):
+        """
+        Returns the counters shared by all processes.
+        """
+        with self:
+            values = struct.unpack_from("<4Q", self.map, self.__header(1))
+        stats = dict(zip(COUNTERS, values))
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
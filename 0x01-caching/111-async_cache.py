@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+
+"""
+Asynchronous caching module.
+
+This module provides an AsyncCache class, an asyncio
+facade over any caching policy. Concurrent misses on
+the same key share a single loader call, blocking
+loaders run in an executor, and eviction callbacks are
+scheduled on the event loop instead of running inside
+the cache operation that evicted.
+"""
+
+import asyncio
+import inspect
+from base_caching import print_discard
+
+LRUCache = __import__('3-lru_cache').LRUCache
+
+
+class AsyncCache():
+    """
+    Represents a caching policy used from coroutines.
+    """
+    def __init__(self, policy=LRUCache, on_evict=None, **options):
+        """
+        Initializes the cache.
+
+        Args:
+            policy (type): The BaseCaching subclass to use.
+            on_evict (callable): Function or coroutine function
+                called with the key and item of each evicted entry,
+                defaults to print_discard.
+            **options: Other arguments for the policy.
+        """
+        self.cache = policy(on_evict=self.__evicted, **options)
+        self.on_evict = print_discard if on_evict is None else on_evict
+        self.pending = {}
+        self.tasks = set()
+
+    def __evicted(self, key, item):
+        """
+        Schedules the eviction callback on the running loop.
+        """
+        loop = asyncio.get_running_loop()
+        if inspect.iscoroutinefunction(self.on_evict):
+            task = loop.create_task(self.on_evict(key, item))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+        else:
+            loop.call_soon(self.on_evict, key, item)
+
+    @property
+    def cache_data(self):
+        """
+        The items stored in the underlying cache.
+        """
+        return self.cache.cache_data
+
+    def print_cache(self):
+        """
+        Prints the cache.
+        """
+        self.cache.print_cache()
+
+    def snapshot(self):
+        """
+        Returns the statistics of the underlying cache.
+        """
+        return self.cache.snapshot()
+
+    async def get(self, key):
+        """
+        Retrieves an item by key.
+        """
+        return self.cache.get(key)
+
+    async def put(self, key, item, ttl=None):
+        """
+        Adds an item in the cache.
+        """
+        self.cache.put(key, item, ttl)
+
+    async def get_many(self, keys):
+        """
+        Retrieves the items of several keys.
+        """
+        return self.cache.get_many(keys)
+
+    async def put_many(self, mapping, ttl=None):
+        """
+        Adds several items in the cache.
+        """
+        self.cache.put_many(mapping, ttl)
+
+    async def get_or_load(self, key, loader, ttl=None):
+        """
+        Returns the cached item of a key, or loads, caches
+        and returns it. Callers that miss on a key while it
+        is loading wait for that load instead of starting one.
+        The load runs in its own task, so cancelling any of
+        the callers, including the first, leaves it running
+        for the others.
+
+        Args:
+            key: The key.
+            loader (callable): Coroutine function, or blocking
+                function run in the default executor, called
+                without arguments to produce the item.
+            ttl (float): Lifetime of the loaded item.
+        """
+        item = self.cache.get(key)
+        if item is not None:
+            return item
+        task = self.pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self.__load(key, loader, ttl))
+            self.pending[key] = task
+            self.tasks.add(task)
+            task.add_done_callback(self.__loaded)
+        return await asyncio.shield(task)
+
+    async def __load(self, key, loader, ttl):
+        """
+        Loads and caches the item of a key.
+        """
+        try:
+            if inspect.iscoroutinefunction(loader):
+                item = await loader()
+            else:
+                item = await asyncio.get_running_loop().run_in_executor(
+                    None, loader)
+            self.cache.put(key, item, ttl)
+            return item
+        finally:
+            del self.pending[key]
+
+    def __loaded(self, task):
+        """
+        Forgets a finished load, marking its exception as
+        retrieved in case every caller was cancelled.
+        """
+        self.tasks.discard(task)
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,43 @@
+#!/usr/bin/python3
+""" 111-main """
+import asyncio
+import time
+
+AsyncCache = __import__('111-async_cache').AsyncCache
+calls = []
+
+
+async def fetch_page():
+    """ A slow coroutine loader """
+    calls.append("page")
+    await asyncio.sleep(0.1)
+    return ["page", 1]
+
+
+def fetch_locale():
+    """ A slow blocking loader """
+    calls.append("locale")
+    time.sleep(0.1)
+    return "fr"
+
+
+async def evicted(key, item):
+    """ An asynchronous eviction callback """
+    print("evicted", key)
+
+
+async def main():
+    """ Coalesces concurrent misses """
+    cache = AsyncCache(max_items=2, on_evict=evicted)
+    pages = await asyncio.gather(
+        *[cache.get_or_load("page", fetch_page) for _ in range(5)])
+    print(pages[0], len(pages))
+    locales = await asyncio.gather(
+        *[cache.get_or_load("locale", fetch_locale) for _ in range(5)])
+    print(locales)
+    print(calls)
+    await cache.put("other", "value")
+    await asyncio.sleep(0)
+    print(await cache.get("page"), cache.snapshot()["evictions"])
+
+asyncio.run(main())
@@ -0,0 +1,39 @@
+#!/usr/bin/python3
+""" 112-main """
+import os
+import tempfile
+import time
+LRUCache = __import__('3-lru_cache').LRUCache
+LFUCache = __import__('100-lfu_cache').LFUCache
+
+path = os.path.join(tempfile.gettempdir(), "112-main.snapshot")
+
+my_cache = LRUCache()
+my_cache.put("A", "Hello")
+my_cache.put("B", "World")
+my_cache.put("C", "Holberton", ttl=0.1)
+my_cache.put("D", "School")
+my_cache.get("A")
+print(my_cache.dump(path))
+
+time.sleep(0.2)
+restored = LRUCache()
+print(restored.load(path))
+restored.print_cache()
+restored.put("E", "Battery")
+restored.put("F", "Street")
+restored.print_cache()
+
+my_cache = LFUCache()
+for key in "ABCD":
+    my_cache.put(key, key.lower())
+for key in "AABBBC":
+    my_cache.get(key)
+my_cache.dump(path)
+restored = LFUCache(max_items=2)
+print(restored.load(path))
+restored.print_cache()
+print(restored.keys_freq)
+
+print(LFUCache().load(os.devnull))
+os.remove(path)
@@ -0,0 +1,20 @@
+#!/usr/bin/python3
+""" 113-main """
+import os
+TieredCache = __import__('113-tiered_cache').TieredCache
+
+my_cache = TieredCache(l2_max_items=3)
+for key in "ABCDEFG":
+    my_cache.put(key, key.lower())
+my_cache.print_cache()
+print(my_cache.get("C"))
+print(my_cache.get("A"))
+my_cache.print_cache()
+print(my_cache.get("Z"))
+stats = my_cache.snapshot()
+print(stats["l1"]["hits"], stats["l1"]["misses"])
+print({name: stats["l2"][name] for name in
+       ("hits", "misses", "demotions", "promotions", "evictions", "items")})
+print(round(stats["hit_ratio"], 2))
+my_cache.close()
+os.remove(my_cache.path)
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+
+"""
+Two-tier caching module.
+
+This module provides a TieredCache class that keeps a
+caching policy in memory (L1) in front of a sqlite
+database on disk (L2). Entries evicted from L1 are
+demoted to L2 instead of being dropped, and L2 hits are
+promoted back to L1, so that each key lives in exactly
+one tier. L2 can be bounded, in which case its least
+recently used rows are discarded.
+
+Each demotion or promotion is committed on its own in
+write-ahead-log mode, so L2 survives a crash of the
+process without one transaction growing for the whole
+life of the cache. The number of L2 rows is counted as
+they are written and deleted instead of being queried.
+"""
+
+import contextlib
+import os
+import pickle
+import sqlite3
+import tempfile
+import time
+from base_caching import print_discard
+
+LRUCache = __import__('3-lru_cache').LRUCache
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key BLOB PRIMARY KEY,
+    item BLOB NOT NULL,
+    expires REAL,
+    used INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_used ON entries (used);
+"""
+COUNTERS = ("hits", "misses", "demotions", "promotions", "evictions")
+
+
+class TieredCache():
+    """
+    Represents a caching policy backed by an on-disk store
+    holding the entries it evicts.
+    """
+    def __init__(self, policy=LRUCache, path=None, l2_max_items=None,
+                 on_evict=None, **options):
+        """
+        Initializes the cache.
+
+        Args:
+            policy (type): The BaseCaching subclass used as L1.
+            path (str): The sqlite database of L2, a new
+                temporary file by default.
+            l2_max_items (int): Maximum number of L2 entries,
+                unbounded by default.
+            on_evict (callable): Called with the key and item of
+                each entry dropped from L2, defaults to
+                print_discard.
+            **options: Other arguments for the policy.
+        """
+        if path is None:
+            fd, path = tempfile.mkstemp(suffix=".sqlite3")
+            os.close(fd)
+        self.path = path
+        self.l2_max_items = l2_max_items
+        self.on_evict = print_discard if on_evict is None else on_evict
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        with self.db:
+            self.db.executescript(SCHEMA)
+        self.clock, self.l2_items = self.db.execute(
+            "SELECT COALESCE(MAX(used), 0), COUNT(*) FROM entries").fetchone()
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.l1 = policy(on_evict=self.__demote, **options)
+
+    def close(self):
+        """
+        Closes the L2 database.
+        """
+        self.db.close()
+
+    def __tick(self):
+        """
+        Returns the next L2 use stamp.
+        """
+        self.clock += 1
+        return self.clock
+
+    def __demote(self, key, item):
+        """
+        Writes an entry evicted from L1 to L2, keeping what
+        is left of its time-to-live.
+        """
+        expires = None
+        deadline = self.l1.expiry.get(key)
+        if deadline is not None:
+            expires = time.time() + deadline - self.l1.timer()
+        key_bytes = pickle.dumps(key)
+        dropped = []
+        with self.__write():
+            self.__delete(key_bytes)
+            self.db.execute(
+                "INSERT INTO entries VALUES (?, ?, ?, ?)",
+                (key_bytes, pickle.dumps(item), expires, self.__tick()))
+            self.l2_items += 1
+            if self.l2_max_items is not None:
+                dropped = self.__trim()
+        self.counters["demotions"] += 1
+        self.__dropped(dropped)
+
+    @contextlib.contextmanager
+    def __write(self):
+        """
+        Runs L2 statements in one committed transaction,
+        counting the L2 rows again if it fails.
+        """
+        try:
+            with self.db:
+                yield
+        except sqlite3.Error:
+            self.l2_items = self.db.execute(
+                "SELECT COUNT(*) FROM entries").fetchone()[0]
+            raise
+
+    def __delete(self, key_bytes):
+        """
+        Deletes the L2 row of a pickled key, if any, and
+        returns whether there was one.
+        """
+        deleted = self.db.execute("DELETE FROM entries WHERE key = ?",
+                                  (key_bytes,)).rowcount
+        self.l2_items -= deleted
+        return deleted > 0
+
+    def __trim(self):
+        """
+        Deletes the least recently used L2 entries beyond
+        the L2 limit and returns them.
+        """
+        excess = self.l2_items - self.l2_max_items
+        if excess <= 0:
+            return []
+        rows = self.db.execute(
+            "SELECT key, item, expires FROM entries ORDER BY used LIMIT ?",
+            (excess,)).fetchall()
+        self.db.executemany("DELETE FROM entries WHERE key = ?",
+                            [(row[0],) for row in rows])
+        self.l2_items -= len(rows)
+        return rows
+
+    def __dropped(self, rows):
+        """
+        Reports the unexpired entries among rows dropped
+        from L2 to on_evict.
+        """
+        now = time.time()
+        for key, item, expires in rows:
+            if expires is None or expires > now:
+                self.counters["evictions"] += 1
+                self.on_evict(pickle.loads(key), pickle.loads(item))
+
+    def l2_size(self):
+        """
+        Returns the number of entries stored in L2.
+        """
+        return self.l2_items
+
+    @property
+    def cache_data(self):
+        """
+        The items stored in L1.
+        """
+        return self.l1.cache_data
+
+    def print_cache(self):
+        """
+        Prints both tiers.
+        """
+        self.l1.print_cache()
+        print("Disk cache:")
+        now = time.time()
+        rows = self.db.execute("SELECT key, item, expires FROM entries")
+        data = {pickle.loads(key): pickle.loads(item)
+                for key, item, expires in rows
+                if expires is None or expires > now}
+        for key in sorted(data.keys()):
+            print("{}: {}".format(key, data.get(key)))
+
+    def put(self, key, item, ttl=None):
+        """
+        Adds an item in L1, dropping any older copy from L2.
+        A key stored in L1 is not in L2, so L2 is only
+        touched for keys that L1 does not hold.
+        """
+        if key is None or item is None:
+            return
+        if self.l2_items and key not in self.l1.cache_data:
+            with self.__write():
+                self.__delete(pickle.dumps(key))
+        self.l1.put(key, item, ttl)
+
+    def get(self, key):
+        """
+        Retrieves an item by key from L1, or else from L2,
+        promoting it to L1.
+        """
+        if key is None:
+            return None
+        item = self.l1.get(key)
+        if item is not None:
+            return item
+        key_bytes = pickle.dumps(key)
+        row = self.db.execute(
+            "SELECT item, expires FROM entries WHERE key = ?",
+            (key_bytes,)).fetchone()
+        if row is None:
+            self.counters["misses"] += 1
+            return None
+        with self.__write():
+            self.__delete(key_bytes)
+        item, expires = pickle.loads(row[0]), row[1]
+        ttl = None
+        if expires is not None:
+            ttl = expires - time.time()
+            if ttl <= 0:
+                self.counters["misses"] += 1
+                return None
+        self.counters["hits"] += 1
+        self.counters["promotions"] += 1
+        self.l1.put(key, item, ttl)
+        return item
+
+    def expire(self):
+        """
+        Removes the expired items of both tiers and returns
+        how many were removed.
+        """
+        with self.__write():
+            removed = self.db.execute(
+                "DELETE FROM entries WHERE expires <= ?",
+                (time.time(),)).rowcount
+            self.l2_items -= removed
+        return self.l1.expire() + removed
+
+    def snapshot(self):
+        """
+        Returns the statistics of each tier, and the hit
+        ratio of the cache as a whole.
+        """
+        l1 = self.l1.snapshot()
+        l2 = dict(self.counters)
+        l2["items"] = self.l2_size()
+        lookups = l2["hits"] + l2["misses"]
+        l2["hit_ratio"] = l2["hits"] / lookups if lookups else 0.0
+        total = l1["hits"] + l1["misses"]
+        hits = l1["hits"] + l2["hits"]
+        return {
+            "l1": l1,
+            "l2": l2,
+            "hit_ratio": hits / total if total else 0.0,
+        }
@@ -18,37 +18,48 @@ class LIFOCache(BaseCaching):
     retrieving items from a dictionary with a LIFO
     removal mechanism when the limit is reached.
     """
-    def __init__(self):
+    def __init__(self, *args, **kwargs):
         """
-        Initializes the cache.
+        Initializes the cache, accepting the same capacity
+        arguments as BaseCaching.
         """
         try:
-            super().__init__()
+            super().__init__(*args, **kwargs)
             self.cache_data = OrderedDict()
         except Exception as e:
             print(f"Error in initialization: {e}")
 
-    def put(self, key, item):
+    def put(self, key, item, ttl=None):
         """
-        Adds an item in the cache.
+        Adds an item in the cache, expiring after ttl seconds
+        (or the default ttl) when one is given.
         """
         try:
             if key is None or item is None:
                 return
-            if key not in self.cache_data:
-                if len(self.cache_data) + 1 > BaseCaching.MAX_ITEMS:
-                    last_key, _ = self.cache_data.popitem(last=True)
-                    print("DISCARD:", last_key)
-            self.cache_data[key] = item
-            self.cache_data.move_to_end(key, last=True)
+            self._store(key, item, ttl)
         except Exception as e:
             print(f"Error in put method: {e}")
 
+    def _update(self, key, item):
+        """
+        Replaces an item, making it the last-in one.
+        """
+        self.cache_data[key] = item
+        self.cache_data.move_to_end(key, last=True)
+
+    def _evict(self):
+        """
+        Removes the last-in item and returns its key
+        and item.
+        """
+        return self.cache_data.popitem(last=True)
+
     def get(self, key):
         """
         Retrieves an item by key.
         """
         try:
-            return self.cache_data.get(key, None)
+            return self._fetch(key)
         except Exception as e:
             print(f"Error in get method: {e}")
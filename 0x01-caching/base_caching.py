@@ -1,18 +1,74 @@
 #!/usr/bin/python3
 """ BaseCaching module
 """
+import heapq
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import time
+
+
+SNAPSHOT_MAGIC = "alx-cache-snapshot"
+SNAPSHOT_VERSION = 1
+
+
+def print_discard(key, item):
+    """ Default eviction callback, printing the discarded key
+    """
+    print("DISCARD:", key)
+
 
 class BaseCaching():
     """ BaseCaching defines:
       - constants of your caching system
       - where your data are stored (in a dictionary)
+      - the item count and byte budgets of each instance
+      - the expiry deadlines of items put with a time-to-live
+      - the counters, latency histograms and eviction callback
+      - the snapshot format used to save and restore the cache
     """
     MAX_ITEMS = 4
 
-    def __init__(self):
+    def __init__(self, max_items=None, max_bytes=None, sizer=None,
+                 default_ttl=None, timer=None, on_evict=None,
+                 timing=False):
         """ Initiliaze
+
+        Args:
+            max_items (int): Maximum number of entries, defaults
+                to MAX_ITEMS.
+            max_bytes (int): Optional maximum total size of the
+                stored items, as measured by sizer.
+            sizer (callable): Returns the size in bytes of an item,
+                defaults to sys.getsizeof.
+            default_ttl (float): Seconds an item lives when put
+                without its own ttl, None for no expiry.
+            timer (callable): Clock used for expiry, defaults to
+                time.monotonic.
+            on_evict (callable): Called with the key and item of
+                each evicted entry, defaults to print_discard.
+            timing (bool): Whether to record get/put latency
+                histograms.
         """
         self.cache_data = {}
+        self.max_items = self.MAX_ITEMS if max_items is None else max_items
+        self.max_bytes = max_bytes
+        self.sizer = sys.getsizeof if sizer is None else sizer
+        self.cache_bytes = 0
+        self.item_sizes = {}
+        self.default_ttl = default_ttl
+        self.timer = time.monotonic if timer is None else timer
+        self.expiry = {}
+        self.expiry_heap = []
+        self.sweeper = None
+        self.on_evict = print_discard if on_evict is None else on_evict
+        self.counters = dict.fromkeys(
+            ("hits", "misses", "insertions", "evictions", "expirations"), 0)
+        self.histograms = None
+        if timing:
+            self.histograms = {"get": [0] * 64, "put": [0] * 64}
 
     def print_cache(self):
         """ Print the cache
@@ -30,3 +86,434 @@ class BaseCaching():
         """ Get an item by key
         """
         raise NotImplementedError("get must be implemented in your cache class")
+
+    def get_many(self, keys):
+        """ Get the items of several keys at once
+
+        Returns:
+            dict: The stored, unexpired items among keys.
+        """
+        found = {}
+        try:
+            lookups = 0
+            for key in keys:
+                lookups += 1
+                if key is not None and self._live(key):
+                    self._touch(key)
+                    found[key] = self.cache_data[key]
+            self.counters["hits"] += len(found)
+            self.counters["misses"] += lookups - len(found)
+        except Exception as e:
+            print(f"Error in get_many method: {e}")
+        return found
+
+    def put_many(self, mapping, ttl=None):
+        """ Add several items at once
+
+        Existing keys are updated first, then room is made for all
+        new keys with a single eviction pass over the entries that
+        were already stored. When the new keys alone exceed a limit,
+        only the last ones that fit are added.
+
+        Args:
+            mapping: A dict, or an iterable of (key, item) pairs.
+            ttl (float): Lifetime of every added item.
+        """
+        try:
+            if hasattr(mapping, "items"):
+                mapping = mapping.items()
+            batch = {}
+            for key, item in mapping:
+                if key is not None and item is not None:
+                    size = self._size_of(item)
+                    if self._fits(size):
+                        batch[key] = (item, size)
+            new = []
+            for key, (item, size) in batch.items():
+                if key in self.cache_data:
+                    self._update(key, item)
+                    self._track(key, size)
+                    self._set_expiry(key, ttl)
+                else:
+                    new.append(key)
+            new_bytes = sum(batch[key][1] for key in new)
+            first = 0
+            while (first < len(new) and
+                   self._overflows(new_bytes, len(new) - first)):
+                new_bytes -= batch[new[first]][1]
+                first += 1
+            new = new[first:]
+            self._make_room(new_bytes, len(new))
+            self.counters["insertions"] += len(new)
+            for key in new:
+                item, size = batch[key]
+                self._insert(key, item)
+                self._track(key, size)
+                self._set_expiry(key, ttl)
+            self._make_room(0, 0)
+        except Exception as e:
+            print(f"Error in put_many method: {e}")
+
+    def snapshot(self):
+        """ Return the counters, sizes and latency histograms
+
+        Histograms map the upper bound of each power-of-two bucket,
+        in nanoseconds, to the number of calls that fell in it.
+        """
+        stats = dict(self.counters)
+        stats["size"] = len(self.cache_data)
+        stats["bytes"] = self.cache_bytes
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = stats["hits"] / lookups if lookups else 0.0
+        if self.histograms is not None:
+            for operation, buckets in self.histograms.items():
+                stats[operation + "_ns"] = {
+                    1 << i: count for i, count in enumerate(buckets) if count
+                }
+        return stats
+
+    def reset_stats(self):
+        """ Zero the counters and latency histograms
+        """
+        for name in self.counters:
+            self.counters[name] = 0
+        if self.histograms is not None:
+            for buckets in self.histograms.values():
+                buckets[:] = [0] * len(buckets)
+
+    def dump(self, path):
+        """ Save the items and policy state of the cache to a file
+
+        A header is followed by one pickled record per entry, written
+        as the policy structures are walked, so the cache is never
+        copied in memory. Records hold the remaining time-to-live of
+        each item, and the header the wall-clock time of the dump, so
+        that time spent on disk counts against it. The file is
+        written under a unique temporary name and replaced atomically
+        once complete; the temporary file is removed on failure.
+
+        Returns:
+            int: The number of entries written.
+        """
+        temp = None
+        try:
+            now = self.timer()
+            count = 0
+            fd, temp = tempfile.mkstemp(
+                dir=os.path.dirname(path) or os.curdir,
+                prefix=os.path.basename(path) + ".", suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump({
+                    "magic": SNAPSHOT_MAGIC,
+                    "version": SNAPSHOT_VERSION,
+                    "policy": type(self).__name__,
+                    "saved_at": time.time(),
+                    "state": self._policy_state(),
+                }, f, pickle.HIGHEST_PROTOCOL)
+                for key, state in self._entries():
+                    deadline = self.expiry.get(key)
+                    ttl = None if deadline is None else deadline - now
+                    pickle.dump((key, self.cache_data[key], state, ttl),
+                                f, pickle.HIGHEST_PROTOCOL)
+                    count += 1
+            os.replace(temp, path)
+            return count
+        except Exception as e:
+            if temp is not None:
+                try:
+                    os.remove(temp)
+                except OSError:
+                    pass
+            print(f"Error in dump method: {e}")
+
+    def load(self, path):
+        """ Replace the content of the cache with a saved snapshot
+
+        Records are read one at a time. Items that expired since the
+        dump are skipped, and entries beyond the current limits are
+        evicted by the policy as they are restored.
+
+        Returns:
+            int: The number of entries restored.
+        """
+        try:
+            with open(path, "rb") as f:
+                header = pickle.load(f)
+                if (header.get("magic") != SNAPSHOT_MAGIC or
+                        header.get("version") != SNAPSHOT_VERSION):
+                    raise ValueError("{} is not a cache snapshot".format(path))
+                if header.get("policy") != type(self).__name__:
+                    raise ValueError("{} holds a {} snapshot".format(
+                        path, header.get("policy")))
+                for key in list(self.cache_data):
+                    self._remove(key)
+                self._restore_policy_state(header["state"])
+                elapsed = max(0.0, time.time() - header["saved_at"])
+                count = 0
+                while True:
+                    try:
+                        key, item, state, ttl = pickle.load(f)
+                    except EOFError:
+                        break
+                    if ttl is not None:
+                        ttl -= elapsed
+                        if ttl <= 0:
+                            continue
+                    size = self._size_of(item)
+                    if not self._fits(size):
+                        continue
+                    self._make_room(size)
+                    self._restore(key, item, state)
+                    self._track(key, size)
+                    self._set_expiry(key, ttl)
+                    count += 1
+            return count
+        except Exception as e:
+            print(f"Error in load method: {e}")
+
+    def _evict(self):
+        """ Remove the next victim of the policy and return its key
+        and item
+        """
+        raise NotImplementedError("_evict must be implemented "
+                                  "in your cache class")
+
+    def _forget(self, key):
+        """ Drop the policy bookkeeping of a key removed out of turn
+        """
+        pass
+
+    def _insert(self, key, item):
+        """ Store a new key where the policy places it
+        """
+        self.cache_data[key] = item
+
+    def _update(self, key, item):
+        """ Replace the item of a stored key
+        """
+        self.cache_data[key] = item
+
+    def _touch(self, key):
+        """ Record a hit on a stored key
+        """
+        pass
+
+    def _entries(self):
+        """ Yield each stored key with its policy state, in the order
+        _restore must receive them to rebuild the policy
+        """
+        for key in self.cache_data:
+            yield key, None
+
+    def _restore(self, key, item, state):
+        """ Store a key read from a snapshot with its policy state
+        """
+        self._insert(key, item)
+
+    def _policy_state(self):
+        """ Policy state that is not attached to a stored key
+        """
+        return None
+
+    def _restore_policy_state(self, state):
+        """ Restore the state returned by _policy_state
+        """
+        pass
+
+    def _size_of(self, item):
+        """ Size of an item, only measured when a byte budget is set
+        """
+        if self.max_bytes is None:
+            return 0
+        return self.sizer(item)
+
+    def _fits(self, size):
+        """ Whether an item of this size can be stored at all
+        """
+        return self.max_bytes is None or size <= self.max_bytes
+
+    def _overflows(self, size, count):
+        """ Whether count entries of size bytes exceed an empty cache
+        """
+        if count > self.max_items:
+            return True
+        return self.max_bytes is not None and size > self.max_bytes
+
+    def _is_full(self, size=0, count=1):
+        """ Whether adding count entries of size bytes trips a limit
+        """
+        if len(self.cache_data) + count > self.max_items:
+            return True
+        return (self.max_bytes is not None and
+                self.cache_bytes + size > self.max_bytes)
+
+    def _track(self, key, size):
+        """ Record the size of a stored item
+        """
+        if self.max_bytes is not None:
+            self.cache_bytes += size - self.item_sizes.get(key, 0)
+            self.item_sizes[key] = size
+
+    def _untrack(self, key):
+        """ Forget the size and deadline of a removed item
+        """
+        self.cache_bytes -= self.item_sizes.pop(key, 0)
+        self.expiry.pop(key, None)
+
+    def _remove(self, key):
+        """ Remove an item regardless of the eviction order
+        """
+        self._forget(key)
+        del self.cache_data[key]
+        self._untrack(key)
+
+    def _set_expiry(self, key, ttl=None):
+        """ Schedule the expiry of a stored item
+        """
+        if ttl is None:
+            ttl = self.default_ttl
+        if ttl is None or key not in self.cache_data:
+            self.expiry.pop(key, None)
+            return
+        deadline = self.timer() + ttl
+        self.expiry[key] = deadline
+        heapq.heappush(self.expiry_heap, (deadline, id(key), key))
+        if len(self.expiry_heap) > 2 * len(self.expiry) + 64:
+            self.expiry_heap = [
+                (d, id(k), k) for k, d in self.expiry.items()
+            ]
+            heapq.heapify(self.expiry_heap)
+
+    def _live(self, key):
+        """ Whether a key is stored and unexpired, dropping it if expired
+        """
+        if key not in self.cache_data:
+            return False
+        if self.expiry:
+            deadline = self.expiry.get(key)
+            if deadline is not None and deadline <= self.timer():
+                self._remove(key)
+                self.counters["expirations"] += 1
+                return False
+        return True
+
+    def expire(self):
+        """ Remove every expired item and return how many were removed
+
+        Deadlines are kept in a heap, so only expired entries and
+        superseded deadlines are visited.
+        """
+        now = self.timer()
+        heap = self.expiry_heap
+        removed = 0
+        while heap and heap[0][0] <= now:
+            deadline, _, key = heapq.heappop(heap)
+            if self.expiry.get(key) == deadline:
+                self._remove(key)
+                removed += 1
+        self.counters["expirations"] += removed
+        return removed
+
+    def start_sweeper(self, interval=1.0, lock=None):
+        """ Expire items from a background thread every interval seconds
+
+        Args:
+            interval (float): Seconds between two sweeps.
+            lock: Lock held by every caller of this cache, if any.
+        """
+        self.stop_sweeper()
+        stopped = threading.Event()
+
+        def sweep():
+            """ Sweeper loop """
+            while not stopped.wait(interval):
+                if lock is None:
+                    self.expire()
+                else:
+                    with lock:
+                        self.expire()
+
+        thread = threading.Thread(target=sweep, daemon=True)
+        self.sweeper = (thread, stopped)
+        thread.start()
+
+    def stop_sweeper(self):
+        """ Stop the background sweeper, if running
+        """
+        if self.sweeper is not None:
+            thread, stopped = self.sweeper
+            stopped.set()
+            thread.join()
+            self.sweeper = None
+
+    def _make_room(self, size=0, count=1):
+        """ Evict entries until count entries of size bytes fit
+
+        Expired items are reclaimed before any live item is evicted.
+        The eviction callback runs before the deadline of the evicted
+        item is forgotten, so it can read it from expiry.
+        """
+        if self.expiry and self._is_full(size, count):
+            self.expire()
+        while self.cache_data and self._is_full(size, count):
+            key, item = self._evict()
+            self.counters["evictions"] += 1
+            try:
+                self.on_evict(key, item)
+            finally:
+                self._untrack(key)
+
+    def _store(self, key, item, ttl=None):
+        """ Add or replace an item, evicting entries as needed
+        """
+        if self.histograms is None:
+            return self._write(key, item, ttl)
+        start = time.perf_counter_ns()
+        try:
+            return self._write(key, item, ttl)
+        finally:
+            self._observe("put", start)
+
+    def _write(self, key, item, ttl=None):
+        """ Store an item on behalf of _store
+        """
+        size = self._size_of(item)
+        if not self._fits(size):
+            return
+        if key not in self.cache_data:
+            self._make_room(size)
+            self._insert(key, item)
+            self._track(key, size)
+            self.counters["insertions"] += 1
+        else:
+            self._update(key, item)
+            self._track(key, size)
+            self._make_room(0, 0)
+        self._set_expiry(key, ttl)
+
+    def _fetch(self, key):
+        """ Return an unexpired item, recording the hit or miss
+        """
+        if self.histograms is None:
+            return self._lookup(key)
+        start = time.perf_counter_ns()
+        try:
+            return self._lookup(key)
+        finally:
+            self._observe("get", start)
+
+    def _lookup(self, key):
+        """ Look an item up on behalf of _fetch
+        """
+        if key is None or not self._live(key):
+            self.counters["misses"] += 1
+            return None
+        self.counters["hits"] += 1
+        self._touch(key)
+        return self.cache_data[key]
+
+    def _observe(self, operation, start):
+        """ Count a latency in its power-of-two nanosecond bucket
+        """
+        elapsed = time.perf_counter_ns() - start
+        self.histograms[operation][min(elapsed.bit_length(), 63)] += 1